@@ -502,9 +502,9 @@ class Repeatedly(Scenario):
 
     def run(self) -> None:
         """Run the scenario."""
-        start = time.time()
+        start = time.monotonic()
         total_ops = 0
-        while (self._seconds == 0 or time.time() - start < self._seconds) and (
+        while (self._seconds == 0 or time.monotonic() - start < self._seconds) and (
             self._operations == 0 or self._operations > total_ops
         ):
             self._action.run()
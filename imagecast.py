@@ -44,7 +44,7 @@ _WAHOO_RESULTS_APP_ID = "34B218B6"
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceStatus:
     """The status of a Chromecast device."""
 
@@ -16,9 +16,12 @@
 
 """The main window."""
 
+import functools
 import os
+import re
 import sys
 from tkinter import FALSE, HORIZONTAL, Menu, StringVar, TclError, Tk, Widget, font, ttk
+from typing import Callable, Optional
 
 from PIL import ImageTk
 
@@ -30,6 +33,50 @@ _PADDING = 2
 _TXT_X_PAD = 5
 _TXT_Y_PAD = 1
 _TXT_PAD = (_TXT_X_PAD, _TXT_Y_PAD)
+_PREWARM_DELAY_MS = 1000
+
+
+def _is_integer_text(text: str) -> bool:
+    """Check whether text is (the start of) a non-negative integer.
+
+    Used to validate keystrokes in Spinboxes so that only numbers can be typed.
+
+    >>> _is_integer_text("")
+    True
+    >>> _is_integer_text("10")
+    True
+    >>> _is_integer_text("1a")
+    False
+    """
+    return re.fullmatch(r"[0-9]*", text) is not None
+
+
+def _is_decimal_text(text: str) -> bool:
+    """Check whether text is (the start of) a non-negative decimal number.
+
+    Used to validate keystrokes in Spinboxes so that only numbers can be typed.
+
+    >>> _is_decimal_text("")
+    True
+    >>> _is_decimal_text("1.")
+    True
+    >>> _is_decimal_text(".25")
+    True
+    >>> _is_decimal_text("1.2.3")
+    False
+    """
+    return re.fullmatch(r"[0-9]*\.?[0-9]*", text) is not None
+
+
+@functools.cache
+def _font_families() -> tuple[str, ...]:
+    """Get the sorted list of installed font families.
+
+    The list is shared by all the font dropdowns, so the (slow) enumeration of
+    the system fonts happens at most once.
+    """
+    # Some platforms report the same family more than once
+    return tuple(sorted(set(font.families())))
 
 
 class View(ttk.Frame):
@@ -71,11 +118,24 @@ class View(ttk.Frame):
         book.add(
             _configTab(book, self._vm), text="Configuration", underline=0, sticky="news"
         )
+        # The other tabs aren't visible at startup, so they are built the
+        # first time they are shown
+        book.add(
+            _LazyTab(book, lambda parent: _dirsTab(parent, self._vm)),
+            text="Directories",
+            underline=0,
+            sticky="news",
+        )
         book.add(
-            _dirsTab(book, self._vm), text="Directories", underline=0, sticky="news"
+            _LazyTab(book, lambda parent: _runTab(parent, self._vm)),
+            text="Run",
+            underline=0,
+            sticky="news",
         )
-        book.add(_runTab(book, self._vm), text="Run", underline=0, sticky="news")
         book.enable_traversal()  # So that Alt-<letter> switches tabs
+        # Enumerate the fonts shortly after the window is up so that the font
+        # dropdowns open quickly, without delaying startup
+        root.after(_PREWARM_DELAY_MS, _font_families)
 
         statusbar = ttk.Frame(self, padding=_PADDING)
         statusbar.grid(column=0, row=1, sticky="news")
@@ -132,12 +192,28 @@ class View(ttk.Frame):
         )
 
 
+class _LazyTab(ttk.Frame):
+    """A notebook page whose contents are built the first time it's shown."""
+
+    def __init__(self, parent: Widget, build: Callable[[Widget], Widget]) -> None:
+        super().__init__(parent)
+        self._build: Optional[Callable[[Widget], Widget]] = build
+        self.bind("<Map>", self._on_map)
+
+    def _on_map(self, _event) -> None:
+        build = self._build
+        if build is None:
+            return
+        self._build = None
+        self.unbind("<Map>")
+        build(self).pack(fill="both", expand=True)
+
+
 class _configTab(ttk.Frame):
     def __init__(self, parent: Widget, vm: Model) -> None:
         super().__init__(parent)
         self._vm = vm
-        self.columnconfigure(0, weight=1, uniform="same1")
-        self.columnconfigure(1, weight=1, uniform="same1")
+        self.columnconfigure((0, 1), weight=1, uniform="same1")
         self.rowconfigure(0, weight=1)
         self._appearance(self).grid(column=0, row=0, rowspan=2, sticky="news")
         self._options_frame(self).grid(column=1, row=0, sticky="news")
@@ -153,34 +229,18 @@ class _configTab(ttk.Frame):
         ttk.Label(txt_frame, text="Main font:", anchor="e").grid(
             column=0, row=0, sticky="news"
         )
-        main_dd = ttk.Combobox(
-            txt_frame, textvariable=self._vm.font_normal, values=sorted(font.families())
-        )
+        main_dd = self._font_dropdown(txt_frame, self._vm.font_normal)
         main_dd.grid(column=1, row=0, sticky="news", pady=_PADDING)
         ToolTip(main_dd, "Main font used for scoreboard text")
-        # Update dropdown if textvar is changed
-        self._vm.font_normal.trace_add(
-            "write", lambda *_: main_dd.set(self._vm.font_normal.get())
-        )
-        # Set initial value
-        main_dd.set(self._vm.font_normal.get())
 
         ttk.Label(txt_frame, text="Time font:", anchor="e").grid(
             column=0, row=1, sticky="news"
         )
-        time_dd = ttk.Combobox(
-            txt_frame, textvariable=self._vm.font_time, values=sorted(font.families())
-        )
+        time_dd = self._font_dropdown(txt_frame, self._vm.font_time)
         time_dd.grid(column=1, row=1, sticky="news", pady=_PADDING)
         ToolTip(
             time_dd, "Font for displaying the times - Recommended: fixed-width font"
         )
-        # Update dropdown if textvar is changed
-        self._vm.font_time.trace_add(
-            "write", lambda *_: time_dd.set(self._vm.font_time.get())
-        )
-        # Set initial value
-        time_dd.set(self._vm.font_time.get())
 
         ttk.Label(txt_frame, text="Title:", anchor="e").grid(
             column=0, row=2, sticky="news"
@@ -200,6 +260,8 @@ class _configTab(ttk.Frame):
             width=4,
             format="%0.2f",
             textvariable=self._vm.text_spacing,
+            validate="key",
+            validatecommand=(self.register(_is_decimal_text), "%P"),
         )
         spspin.grid(column=1, row=3, sticky="nws", pady=_PADDING)
         ToolTip(spspin, "Vertical space between text lines")
@@ -208,60 +270,30 @@ class _configTab(ttk.Frame):
 
         colorframe = ttk.Frame(mainframe)
         colorframe.pack(side="top", fill="x")
-        colorframe.columnconfigure(1, weight=1)
-        colorframe.columnconfigure(3, weight=1)
-        colorframe.columnconfigure(5, weight=1)
-        # 1st col
-        ttk.Label(colorframe, text="Heading:", anchor="e").grid(
-            column=0, row=0, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_title).grid(
-            column=1, row=0, sticky="nws", pady=_PADDING
-        )
-        ttk.Label(colorframe, text="Event:", anchor="e").grid(
-            column=0, row=1, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_event).grid(
-            column=1, row=1, sticky="nws", pady=_PADDING
-        )
-        # 2nd col
-        ttk.Label(colorframe, text="1st place:", anchor="e").grid(
-            column=2, row=0, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_first).grid(
-            column=3, row=0, sticky="nws", pady=_PADDING
-        )
-        ttk.Label(colorframe, text="2nd place:", anchor="e").grid(
-            column=2, row=1, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_second).grid(
-            column=3, row=1, sticky="nws", pady=_PADDING
-        )
-        ttk.Label(colorframe, text="3rd place:", anchor="e").grid(
-            column=2, row=2, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_third).grid(
-            column=3, row=2, sticky="nws", pady=_PADDING
-        )
-        # 3rd col
-        ttk.Label(colorframe, text="Odd rows:", anchor="e").grid(
-            column=4, row=0, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_odd).grid(
-            column=5, row=0, sticky="nws", pady=_PADDING
-        )
-        ttk.Label(colorframe, text="Even rows:", anchor="e").grid(
-            column=4, row=1, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_even).grid(
-            column=5, row=1, sticky="nws", pady=_PADDING
-        )
-        ttk.Label(colorframe, text="Background:", anchor="e").grid(
-            column=4, row=2, sticky="news"
-        )
-        widgets.ColorButton2(colorframe, color_var=self._vm.color_bg).grid(
-            column=5, row=2, sticky="nws", pady=_PADDING
-        )
+        colorframe.columnconfigure((1, 3, 5), weight=1)
+        # (label, variable) for each color, laid out in columns of 3 rows
+        colors = (
+            ("Heading:", self._vm.color_title),
+            ("Event:", self._vm.color_event),
+            None,
+            ("1st place:", self._vm.color_first),
+            ("2nd place:", self._vm.color_second),
+            ("3rd place:", self._vm.color_third),
+            ("Odd rows:", self._vm.color_odd),
+            ("Even rows:", self._vm.color_even),
+            ("Background:", self._vm.color_bg),
+        )
+        for index, color in enumerate(colors):
+            if color is None:
+                continue
+            text, var = color
+            column, row = divmod(index, 3)
+            ttk.Label(colorframe, text=text, anchor="e").grid(
+                column=2 * column, row=row, sticky="news"
+            )
+            widgets.ColorButton2(colorframe, color_var=var).grid(
+                column=2 * column + 1, row=row, sticky="nws", pady=_PADDING
+            )
 
         ttk.Separator(mainframe, orient=HORIZONTAL).pack(side="top", fill="x", pady=10)
 
@@ -278,25 +310,24 @@ class _configTab(ttk.Frame):
             increment=5,
             width=4,
             textvariable=self._vm.brightness_bg,
+            validate="key",
+            validatecommand=(self.register(_is_integer_text), "%P"),
         )
         bg_bgight_spin.grid(column=1, row=0, sticky="nws", pady=_PADDING)
         ToolTip(bg_bgight_spin, "Brightness of the background image (percent: 0-100)")
         ttk.Label(bgframelabels, text="Background image:", anchor="e").grid(
             column=0, row=1, sticky="news"
         )
-        self._bg_img_label = StringVar()
-        bg_img_label = ttk.Label(
-            bgframelabels, textvariable=self._bg_img_label, anchor="w", relief="sunken"
-        )
+        bg_img_label = ttk.Label(bgframelabels, anchor="w", relief="sunken")
         bg_img_label.grid(column=1, row=1, sticky="news")
         ToolTip(bg_img_label, "Scoreboard background image - Recommended: 1280x720")
-        self._vm.image_bg.trace_add(
-            "write",
-            lambda *_: self._bg_img_label.set(
-                os.path.basename(self._vm.image_bg.get())[-20:]
-            ),
-        )
-        self._vm.image_bg.set(self._vm.image_bg.get())
+
+        def update_bg_img_label() -> None:
+            text = os.path.basename(self._vm.image_bg.get())[-20:]
+            bg_img_label.configure(text=text)
+
+        self._vm.image_bg.trace_add("write", lambda *_: update_bg_img_label())
+        update_bg_img_label()
 
         bgframebtns = ttk.Frame(mainframe)
         bgframebtns.pack(side="top", fill="x")
@@ -308,6 +339,23 @@ class _configTab(ttk.Frame):
         )
         return mainframe
 
+    def _font_dropdown(self, parent: Widget, var: StringVar) -> ttk.Combobox:
+        """Create a dropdown for choosing a font family.
+
+        Enumerating the installed fonts is slow, so the list of choices is
+        only filled in the first time the dropdown is opened.
+        """
+        # Read-only so that a font can only be chosen from the list; typing a
+        # name would re-render the preview with each partial name
+        dropdown = ttk.Combobox(parent, textvariable=var, state="readonly")
+
+        def fill_families() -> None:
+            if not dropdown.cget("values"):
+                dropdown.configure(values=_font_families())
+
+        dropdown.configure(postcommand=fill_families)
+        return dropdown
+
     def _options_frame(self, parent: Widget) -> Widget:
         opt_frame = ttk.LabelFrame(parent, text="Options")
 
@@ -321,6 +369,8 @@ class _configTab(ttk.Frame):
             increment=1,
             width=3,
             textvariable=self._vm.num_lanes,
+            validate="key",
+            validatecommand=(self.register(_is_integer_text), "%P"),
         )
         lspin.grid(column=1, row=0, sticky="news", pady=_PADDING)
         ToolTip(lspin, "Number of lanes to display")
@@ -335,6 +385,8 @@ class _configTab(ttk.Frame):
             increment=1,
             width=3,
             textvariable=self._vm.min_times,
+            validate="key",
+            validatecommand=(self.register(_is_integer_text), "%P"),
         )
         tspin.grid(column=1, row=1, sticky="news", pady=_PADDING)
         ToolTip(
@@ -353,6 +405,8 @@ class _configTab(ttk.Frame):
             increment=0.1,
             width=4,
             textvariable=self._vm.time_threshold,
+            validate="key",
+            validatecommand=(self.register(_is_decimal_text), "%P"),
         )
         thresh.grid(column=1, row=2, sticky="news", pady=_PADDING)
         ToolTip(
@@ -365,8 +419,7 @@ class _configTab(ttk.Frame):
 
     def _preview(self, parent: Widget) -> Widget:
         frame = ttk.LabelFrame(parent, text="Scoreboard preview")
-        frame.columnconfigure(0, weight=1)
-        widgets.Preview(frame, self._vm.appearance_preview).grid(column=0, row=0)
+        widgets.Preview(frame, self._vm.appearance_preview).pack(side="top")
         ToolTip(frame, "Mockup of how the scoreboard will look")
         return frame
 
@@ -375,8 +428,7 @@ class _dirsTab(ttk.Frame):
     def __init__(self, parent: Widget, vm: Model) -> None:
         super().__init__(parent)
         self._vm = vm
-        self.columnconfigure(0, weight=1, uniform="same1")
-        self.columnconfigure(1, weight=1, uniform="same1")
+        self.columnconfigure((0, 1), weight=1, uniform="same1")
         self.rowconfigure(0, weight=1)
         self._start_list(self).grid(column=0, row=0, sticky="news", padx=1, pady=1)
         self._race_results(self).grid(column=1, row=0, sticky="news", padx=1, pady=1)
@@ -422,8 +474,7 @@ class _runTab(ttk.Frame):
     def __init__(self, parent: Widget, vm: Model) -> None:
         super().__init__(parent)
         self._vm = vm
-        self.columnconfigure(0, weight=1)
-        self.columnconfigure(1, weight=1)
+        self.columnconfigure((0, 1), weight=1)
         self.rowconfigure(0, weight=1)
         self._cc_selector(self).grid(column=1, row=0, sticky="news")
         self._preview(self).grid(column=1, row=1, sticky="news")
@@ -433,17 +484,13 @@ class _runTab(ttk.Frame):
 
     def _cc_selector(self, parent: Widget) -> Widget:
         frame = ttk.LabelFrame(parent, text="Available Chromecasts")
-        frame.columnconfigure(0, weight=1)
-        frame.rowconfigure(0, weight=1)
         ccs = widgets.ChromcastSelector(frame, self._vm.cc_status)
-        ccs.grid(column=0, row=0, sticky="news")
+        ccs.pack(fill="both", expand=True)
         ToolTip(ccs, "Chromecasts that have been detected. Click to toggle.")
         return frame
 
     def _preview(self, parent: Widget) -> Widget:
         frame = ttk.LabelFrame(parent, text="Scoreboard preview")
-        frame.columnconfigure(0, weight=1)
-        frame.rowconfigure(0, weight=1)
-        widgets.Preview(frame, self._vm.scoreboard).grid(column=0, row=0)
+        widgets.Preview(frame, self._vm.scoreboard).pack(expand=True)
         ToolTip(frame, "Current contents of the scoreboard")
         return frame
@@ -18,8 +18,10 @@
 
 import logging
 import queue
+import time
 import uuid
 from configparser import ConfigParser
+from dataclasses import dataclass
 from tkinter import BooleanVar, DoubleVar, IntVar, StringVar, Tk, Variable
 from typing import Callable, Generic, List, Optional, Set, TypeVar
 
@@ -31,6 +33,8 @@ from raceinfo import HeatData, StartList
 CallbackFn = Callable[[], None]
 
 _INI_HEADING = "wahoo-results"
+# How long queued functions may run before tkinter gets to process events
+_DISPATCH_SLICE_SECS = 0.02
 
 _T = TypeVar("_T")
 
@@ -110,6 +114,32 @@ class RaceResultVar(GVar[Optional[HeatData]]):
     """A race result."""
 
 
+@dataclass(frozen=True, slots=True)
+class RenderConfig:
+    """
+    The settings that determine the appearance of the scoreboard.
+
+    This is a snapshot of the model (see Model.snapshot()). Unlike the model,
+    it can be used from any thread.
+    """
+
+    num_lanes: int
+    font_normal: str
+    font_time: str
+    text_spacing: float
+    title: str
+    image_bg: str
+    brightness_bg: int
+    color_title: str
+    color_event: str
+    color_even: str
+    color_odd: str
+    color_first: str
+    color_second: str
+    color_third: str
+    color_bg: str
+
+
 class Model:
     """Defines the state variables (model) for the main UI."""
 
@@ -261,6 +291,32 @@ class Model:
         with open(filename, "w", encoding="utf-8") as file:
             config.write(file)
 
+    def snapshot(self) -> RenderConfig:
+        """Capture the current scoreboard appearance settings.
+
+        This must be called from the tkinter main thread.
+
+        :returns: The current settings
+        :raises TclError: If a setting can't be parsed (e.g., a partial entry)
+        """
+        return RenderConfig(
+            num_lanes=self.num_lanes.get(),
+            font_normal=self.font_normal.get(),
+            font_time=self.font_time.get(),
+            text_spacing=self.text_spacing.get(),
+            title=self.title.get(),
+            image_bg=self.image_bg.get(),
+            brightness_bg=self.brightness_bg.get(),
+            color_title=self.color_title.get(),
+            color_event=self.color_event.get(),
+            color_even=self.color_even.get(),
+            color_odd=self.color_odd.get(),
+            color_first=self.color_first.get(),
+            color_second=self.color_second.get(),
+            color_third=self.color_third.get(),
+            color_bg=self.color_bg.get(),
+        )
+
     def enqueue(self, func: Callable[[], None]) -> None:
         """Enqueue a function to be executed by the tkinter main thread.
 
@@ -269,13 +325,18 @@ class Model:
         self._event_queue.put(func)
 
     def _dispatch_event(self) -> None:
+        deadline = time.monotonic() + _DISPATCH_SLICE_SECS
         try:
-            func = self._event_queue.get_nowait()
-            logger.debug("Dispatching function from queue: %s", func.__name__)
-            func()
-            self._event_queue.task_done()
-            # Give tkinter a chance to process events
-            self.root.after_idle(self._dispatch_event)
+            # Drain the queue in a single pass unless it takes too long
+            while True:
+                func = self._event_queue.get_nowait()
+                logger.debug("Dispatching function from queue: %s", func.__name__)
+                func()
+                self._event_queue.task_done()
+                if time.monotonic() >= deadline:
+                    # Give tkinter a chance to process events
+                    self.root.after_idle(self._dispatch_event)
+                    return
         except queue.Empty:
             # No more events to process, check again later
             self.root.after(10, self._dispatch_event)
@@ -19,11 +19,15 @@
 import io
 import os
 import re
-from typing import List
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from .heatdata import HeatData
 from .startlist import StartList
 
+_HEADER_RE = re.compile(r"^#(\w+)\s+(.*)$")
+
 
 def parse_scb(stream: io.TextIOBase) -> StartList:
     """
@@ -42,11 +46,10 @@ def parse_scb(stream: io.TextIOBase) -> StartList:
                 ...
     """
     header = stream.readline()
-    match = re.match(r"^#(\w+)\s+(.*)$", header)
+    match = _HEADER_RE.match(header)
     if not match:
         raise ValueError("Unable to parse header")
-    event = match.group(1)
-    description = match.group(2)
+    event, description = match.groups()
 
     # The format always has 10 lines (lanes) per heat
     lines = stream.readlines()
@@ -54,27 +57,23 @@ def parse_scb(stream: io.TextIOBase) -> StartList:
         raise ValueError("Length is not a multiple of 10")
     num_heats = (len(lines)) // 10
 
-    # Reverse the lines because we're going to pop() them later and we
-    # want to read them in order.
-    lines.reverse()
-
+    rows = iter(lines)
     heatlist: List[HeatData] = []
     for h_index in range(num_heats):
         lanes: List[HeatData.Lane] = []
         for _lane in range(10):
-            line = lines.pop()
+            line = next(rows).removesuffix("\n")
             # Each entry is fixed length:
             #  - Swimmer name: 20 char
             #  - Literal: "--"
             #  - Swimmer team: 16 char
             # Total line length: 38 char
             # Excess area is space-filled
-            match = re.match(r"^(.{20})--(.{16})$", line)
-            if not match:
+            if len(line) != 38 or line[20:22] != "--":  # noqa: PLR2004
                 raise ValueError(f"Unable to parse line: '{line}'")
-            lanes.append(
-                HeatData.Lane(name=match.group(1).strip(), team=match.group(2).strip())
-            )
+            # A meet has only a few teams, so share one copy of each name
+            team = sys.intern(line[22:].strip())
+            lanes.append(HeatData.Lane(name=line[:20].strip(), team=team))
         heatlist.append(
             HeatData(
                 description=description, event=event, heat=h_index + 1, lanes=lanes
@@ -96,22 +95,46 @@ def parse_scb_file(file_path: str) -> StartList:
         return parse_scb(file)
 
 
+# Parsed start lists from the most recently loaded directory, keyed by file
+# path and tagged with the (mtime, size) of the file when it was parsed
+_FileStamp = Tuple[int, int]
+_scb_cache: Dict[str, Dict[str, Tuple[_FileStamp, StartList]]] = {}
+
+
 def load_all_scb(directory: str) -> List[StartList]:
     """Load all the start list .scb files from a directory.
 
+    Files that are unchanged since the previous call for the same directory
+    are not re-read.
+
     :param directory: The directory to scan for .scb files
     :returns: A list of StartList objects, one for each .scb file found
     """
-    files = os.scandir(directory)
-    startlists: List[StartList] = []
-    for file in files:
-        if file.name.endswith(".scb"):
-            try:
-                startlist = parse_scb_file(file.path)
-                startlists.append(startlist)
-            except ValueError:  # Problem parsing the file
-                pass
-            except FileNotFoundError:  # File was deleted after we read the dir
-                pass
+    with os.scandir(directory) as files:
+        entries = [file for file in files if file.name.endswith(".scb")]
+    cache = _scb_cache.get(directory, {})
+    # A meet has dozens of start lists, so overlap reading them
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loaded = executor.map(lambda entry: _load_scb_entry(entry, cache), entries)
+        parsed = {path: item for path, item in loaded if item is not None}
+    _scb_cache.clear()
+    _scb_cache[directory] = parsed
+    startlists = [startlist for _, startlist in parsed.values()]
     startlists.sort(key=lambda x: x[0])
     return startlists
+
+
+def _load_scb_entry(
+    entry: os.DirEntry[str], cache: Dict[str, Tuple[_FileStamp, StartList]]
+) -> Tuple[str, Optional[Tuple[_FileStamp, StartList]]]:
+    try:
+        stat = entry.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = cache.get(entry.path)
+        if cached is not None and cached[0] == stamp:
+            return (entry.path, cached)
+        return (entry.path, (stamp, parse_scb_file(entry.path)))
+    except ValueError:  # Problem parsing the file
+        return (entry.path, None)
+    except FileNotFoundError:  # File was deleted after we read the dir
+        return (entry.path, None)
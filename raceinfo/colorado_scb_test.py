@@ -17,12 +17,14 @@
 """Colorado SCB file format tests."""
 
 import io
+import os
 import textwrap
 from datetime import datetime
 
 import pytest
 
-from .colorado_scb import parse_scb
+from . import colorado_scb
+from .colorado_scb import load_all_scb, parse_scb
 from .times import NumericTime
 
 _now = datetime.now()
@@ -258,3 +260,100 @@ class TestColoradoSCB:
         assert lane6.team == "LONGLONGLONGLONG"
         lane2 = heatlist[0].lane(2)
         assert lane2.is_empty
+
+
+def _write_scb(path, event: str, description: str, heats: int = 1) -> None:
+    """Write a start list file with empty lanes."""
+    lines = [f"#{event} {description}\n"]
+    lines += [f"{'':20}--{'':16}\n"] * (10 * heats)
+    with open(path, "w", encoding="cp1252") as file:
+        file.writelines(lines)
+
+
+class TestLoadAllSCB:
+    """Tests for loading (and caching) a directory of start lists."""
+
+    @pytest.fixture(autouse=True)
+    def parsed(self, monkeypatch):
+        """Start with an empty cache and record the files that get parsed."""
+        monkeypatch.setattr(colorado_scb, "_scb_cache", {})
+        parsed = []
+        parse = colorado_scb.parse_scb_file
+
+        def counting_parse(file_path):
+            parsed.append(os.path.basename(file_path))
+            return parse(file_path)
+
+        monkeypatch.setattr(colorado_scb, "parse_scb_file", counting_parse)
+        return parsed
+
+    def test_loads_sorted_startlists(self, tmp_path, parsed):
+        """Only .scb files are loaded, and unparsable ones are skipped."""
+        _write_scb(tmp_path / "E002.scb", "2", "BOYS 8&U 25 FREE")
+        _write_scb(tmp_path / "E001.scb", "1", "GIRLS 8&U 25 FREE")
+        (tmp_path / "E003.scb").write_text("INVALID HEADER\n")
+        (tmp_path / "notes.txt").write_text("not a start list\n")
+        startlists = load_all_scb(str(tmp_path))
+        assert [slist[0].event for slist in startlists] == ["1", "2"]
+        assert sorted(parsed) == ["E001.scb", "E002.scb", "E003.scb"]
+
+    def test_unchanged_file_is_reused(self, tmp_path, parsed):
+        """A file that hasn't changed isn't parsed again."""
+        _write_scb(tmp_path / "E001.scb", "1", "GIRLS 8&U 25 FREE")
+        first = load_all_scb(str(tmp_path))
+        second = load_all_scb(str(tmp_path))
+        assert parsed == ["E001.scb"]
+        assert second[0] is first[0]
+
+    def test_file_with_new_mtime_is_reparsed(self, tmp_path, parsed):
+        """A file is parsed again if its modification time changes."""
+        path = tmp_path / "E001.scb"
+        _write_scb(path, "1", "GIRLS 8&U 25 FREE")
+        load_all_scb(str(tmp_path))
+        mtime = os.stat(path).st_mtime_ns
+        # Same size, new contents
+        _write_scb(path, "1", "GIRLS 8&U 25 BACK")
+        os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+        startlists = load_all_scb(str(tmp_path))
+        assert parsed == ["E001.scb", "E001.scb"]
+        assert startlists[0][0].description == "GIRLS 8&U 25 BACK"
+
+    def test_file_with_new_size_is_reparsed(self, tmp_path, parsed):
+        """A file is parsed again if its size changes."""
+        path = tmp_path / "E001.scb"
+        _write_scb(path, "1", "GIRLS 8&U 25 FREE")
+        load_all_scb(str(tmp_path))
+        mtime = os.stat(path).st_mtime_ns
+        # Same mtime, different size
+        _write_scb(path, "1", "GIRLS 8&U 25 FREE", heats=2)
+        os.utime(path, ns=(mtime, mtime))
+        startlists = load_all_scb(str(tmp_path))
+        assert parsed == ["E001.scb", "E001.scb"]
+        assert len(startlists[0]) == 2  # noqa: PLR2004
+
+    def test_deleted_file_is_dropped(self, tmp_path):
+        """A file that has been removed is no longer returned."""
+        _write_scb(tmp_path / "E001.scb", "1", "GIRLS 8&U 25 FREE")
+        _write_scb(tmp_path / "E002.scb", "2", "BOYS 8&U 25 FREE")
+        assert len(load_all_scb(str(tmp_path))) == 2  # noqa: PLR2004
+        os.remove(tmp_path / "E001.scb")
+        startlists = load_all_scb(str(tmp_path))
+        assert [slist[0].event for slist in startlists] == ["2"]
+        assert list(colorado_scb._scb_cache[str(tmp_path)]) == [
+            str(tmp_path / "E002.scb")
+        ]
+
+    def test_switching_directories_clears_cache(self, tmp_path, parsed):
+        """Only the most recently loaded directory is cached."""
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        _write_scb(dir_a / "E001.scb", "1", "GIRLS 8&U 25 FREE")
+        _write_scb(dir_b / "E002.scb", "2", "BOYS 8&U 25 FREE")
+        load_all_scb(str(dir_a))
+        load_all_scb(str(dir_b))
+        assert list(colorado_scb._scb_cache) == [str(dir_b)]
+        # Going back to the first directory parses its files again
+        load_all_scb(str(dir_a))
+        assert parsed == ["E001.scb", "E002.scb", "E001.scb"]
@@ -25,6 +25,10 @@ from typing import List
 from .heatdata import HeatData
 from .times import NumericTime
 
+_FILENAME_RE = re.compile(r"^(\d+)-\d+-\d+\w-(\d+)\.")
+_HEADER_RE = re.compile(r"^(\d*);(\d+);\w+;\w+$")
+_LANE_RE = re.compile(r"^Lane\d+;([\d\.]*);([\d\.]*);([\d\.]*)$")
+
 
 def parse_do4_file(file_path: str) -> HeatData:
     """
@@ -42,7 +46,7 @@ def parse_do4_file(file_path: str) -> HeatData:
     # is the race number
     # We're only parsing the items from the file name that we can't get from
     # the file contents.
-    matcher = re.match(r"^(\d+)-\d+-\d+\w-(\d+)\.", os.path.basename(file_path))
+    matcher = _FILENAME_RE.match(os.path.basename(file_path))
     if matcher is not None:
         meet_id = matcher.group(1)
         race_number = int(matcher.group(2))
@@ -65,23 +69,22 @@ def parse_do4(stream: io.TextIOBase) -> HeatData:
     :raises ValueError: If the data is not in the expected format
     """
     header = stream.readline()
-    match = re.match(r"^(\d*);(\d+);\w+;\w+$", header)
+    match = _HEADER_RE.match(header)
     if not match:
         raise ValueError("Unable to parse header")
-    event = match.group(1)
-    heat = int(match.group(2))
+    event, heat_text = match.groups()
+    heat = int(heat_text)
 
     lines = stream.readlines()
     if len(lines) != 11:  # noqa: PLR2004
         raise ValueError("Invalid number of lines in file")
     lanes: List[HeatData.Lane] = []
     for lane in range(10):
-        match = re.match(r"^Lane\d+;([\d\.]*);([\d\.]*);([\d\.]*)$", lines[lane])
+        match = _LANE_RE.match(lines[lane])
         if not match:
             raise ValueError("Unable to parse times")
         lane_times: List[NumericTime] = []
-        for index in range(1, 4):
-            match_txt = match.group(index)
+        for match_txt in match.groups():
             time = NumericTime("0")
             if match_txt != "":
                 time = max(NumericTime(match_txt), time)
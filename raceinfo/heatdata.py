@@ -23,6 +23,9 @@ from typing import Optional
 
 from .times import NT, ZERO_TIME, NumericTime, Time, TimeResolver, is_special_time
 
+# An event is a number with an optional letter suffix (e.g., "5" or "10S")
+_EVENT_RE = re.compile(r"^(\d+)([A-Z]*)$")
+
 
 @dataclass(kw_only=True)
 class HeatData:
@@ -46,7 +49,7 @@ class HeatData:
     :raises: ValueError if any of the parameters are invalid
     """
 
-    @dataclass(kw_only=True)
+    @dataclass(kw_only=True, slots=True)
     class Lane:
         """
         The per-lane information for a heat.
@@ -92,7 +95,7 @@ class HeatData:
             # Mark the lane as empty if there are no times or all times are zero
             # and there's no name or team
             if (
-                all(time == NumericTime(0) for time in self.times)
+                all(time == ZERO_TIME for time in self.times)
                 and not self.name
                 and not self.team
             ):
@@ -178,7 +181,7 @@ class HeatData:
         :returns: The lane object
         :raises: ValueError if the lane number is invalid
         """
-        if lane_number < 1 or lane_number > 10:  # noqa: PLR2004
+        if not 1 <= lane_number <= 10:  # noqa: PLR2004
             raise ValueError("Lane number must be between 1 and 10")
         return self._lanes[lane_number - 1]
 
@@ -288,9 +291,8 @@ class HeatData:
         # The event number is a string, composed of a number and an optional
         # letter. Sort by the number first, then by the letter. For example,
         # '1Z' comes before '10S'
-        pattern = r"^(\d+)([A-Z]*)$"
-        self_match = re.match(pattern, self.event.upper())
-        other_match = re.match(pattern, other.event.upper())
+        self_match = _EVENT_RE.match(self.event.upper())
+        other_match = _EVENT_RE.match(other.event.upper())
         if not self_match or not other_match:
             return (
                 self.event.upper() < other.event.upper()
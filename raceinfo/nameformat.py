@@ -16,9 +16,24 @@
 
 """Functions for (re)-formatting names."""
 
+import functools
 import re
 from enum import Enum, auto, unique
-from typing import List
+from typing import List, Optional, Tuple
+
+# This regex match is terribly ugly... here's how it works:
+# - Match groups are named via (?P<name>...)
+# - Last name is required to be present. The end of the last name is
+# demarcated by a comma
+# - The separation between Last and First is a comma and 1 or more space
+# characters. The First name portion goes until the next whitespace
+# character, if any.
+# - The middle (initial) is any remaining non-whitespace in the name
+# - The CTS start list names are placed into a 20-character field, so we
+# need to be able to properly parse w/ ws at the end (or not).
+_NAME_RE = re.compile(
+    r"^(?P<l>(?P<li>[^,])[^,]*)(,\s+(?P<f>(?P<fi>\w)\w*)(\s+(?P<m>\w+))?)?"
+)
 
 
 @unique
@@ -41,7 +56,32 @@ class NameMode(Enum):
     """Format name as: Last"""
 
 
-def arrange_name(how: NameMode, name: str) -> str:  # noqa: PLR0911
+# The sequence of progressively shorter formats to try for each NameMode
+_FALLBACKS = {
+    NameMode.NONE: (
+        NameMode.NONE,
+        NameMode.LAST_FIRST,
+        NameMode.LAST_FIRSTINITIAL,
+        NameMode.LAST,
+    ),
+    NameMode.FIRST: (NameMode.FIRST,),
+    NameMode.FIRST_LAST: (
+        NameMode.FIRST_LAST,
+        NameMode.FIRST_LASTINITIAL,
+        NameMode.FIRST,
+    ),
+    NameMode.FIRST_LASTINITIAL: (NameMode.FIRST_LASTINITIAL, NameMode.FIRST),
+    NameMode.LAST_FIRST: (
+        NameMode.LAST_FIRST,
+        NameMode.LAST_FIRSTINITIAL,
+        NameMode.LAST,
+    ),
+    NameMode.LAST_FIRSTINITIAL: (NameMode.LAST_FIRSTINITIAL, NameMode.LAST),
+    NameMode.LAST: (NameMode.LAST,),
+}
+
+
+def arrange_name(how: NameMode, name: str) -> str:
     """
     Change the format of a name from a start list.
 
@@ -68,20 +108,15 @@ def arrange_name(how: NameMode, name: str) -> str:  # noqa: PLR0911
     >>> arrange_name(NameMode.LAST, "Last, First         ")
     'Last'
     """
-    # This regex match is terribly ugly... here's how it works:
-    # - Match groups are named via (?P<name>...)
-    # - Last name is required to be present. The end of the last name is
-    # demarcated by a comma
-    # - The separation between Last and First is a comma and 1 or more space
-    # characters. The First name portion goes until the next whitespace
-    # character, if any.
-    # - The middle (initial) is any remaining non-whitespace in the name
-    # - The CTS start list names are placed into a 20-character field, so we
-    # need to be able to properly parse w/ ws at the end (or not).
-    match = re.match(
-        r"^(?P<l>(?P<li>[^,])[^,]*)(,\s+(?P<f>(?P<fi>\w)\w*)(\s+(?P<m>\w+))?)?", name
-    )
-    if not match:
+    if how == NameMode.NONE:  # Verbatim, so there's no need to parse the name
+        return name.strip()
+    return _render_name(how, name, _NAME_RE.match(name))
+
+
+def _render_name(  # noqa: PLR0911
+    how: NameMode, name: str, match: Optional[re.Match[str]]
+) -> str:
+    if how == NameMode.NONE or not match:
         return name.strip()
     if how == NameMode.FIRST:
         return f"{match.group('f')}"
@@ -95,7 +130,6 @@ def arrange_name(how: NameMode, name: str) -> str:  # noqa: PLR0911
         return f"{match.group('l')}, {match.group('fi')}"
     if how == NameMode.LAST:
         return f"{match.group('l')}"
-    # default is NameMode.NONE
     return name.strip()
 
 
@@ -114,22 +148,16 @@ def format_name(how: NameMode, name: str) -> List[str]:
     >>> format_name(NameMode.FIRST_LAST, "Last, First M")
     ['First Last', 'First L', 'First', 'Firs', 'Fir', 'Fi', 'F', '']
     """
-    variants = []
-    if how == NameMode.FIRST_LAST:
-        variants = format_name(NameMode.FIRST_LASTINITIAL, name)
-    if how == NameMode.FIRST_LASTINITIAL:
-        variants = format_name(NameMode.FIRST, name)
-    if how == NameMode.FIRST:
-        variants = _shorter_strings(arrange_name(how, name))
-    if how == NameMode.NONE:
-        variants = format_name(NameMode.LAST_FIRST, name)
-    if how == NameMode.LAST_FIRST:
-        variants = format_name(NameMode.LAST_FIRSTINITIAL, name)
-    if how == NameMode.LAST_FIRSTINITIAL:
-        variants = format_name(NameMode.LAST, name)
-    if how == NameMode.LAST:
-        variants = _shorter_strings(arrange_name(how, name))
-    return [arrange_name(how, name), *variants]
+    return list(_name_variants(how, name))
+
+
+# The scoreboard formats the same handful of names on every render
+@functools.lru_cache(maxsize=256)
+def _name_variants(how: NameMode, name: str) -> Tuple[str, ...]:
+    # Parse the name once and render it in each of the fallback formats
+    match = _NAME_RE.match(name)
+    variants = [_render_name(mode, name, match) for mode in _FALLBACKS[how]]
+    return (*variants, *_shorter_strings(variants[-1]))
 
 
 def _shorter_strings(string: str) -> List[str]:
@@ -142,7 +170,4 @@ def _shorter_strings(string: str) -> List[str]:
     >>> _shorter_strings("foobar")
     ['fooba', 'foob', 'foo', 'fo', 'f', '']
     """
-    if len(string) > 0:
-        shortened = string[:-1]
-        return [shortened, *_shorter_strings(shortened)]
-    return []
+    return [string[:length] for length in range(len(string) - 1, -1, -1)]
@@ -16,6 +16,9 @@
 
 """Functions for manipulating Startlists."""
 
+import csv
+from typing import Iterator, TextIO
+
 from .heatdata import HeatData
 
 StartList = list[HeatData]
@@ -54,23 +57,33 @@ def is_valid(startlist: StartList) -> bool:
     return True
 
 
-def startlists_to_csv(startlists: list[StartList]) -> list[str]:
+def write_startlists_csv(startlists: list[StartList], stream: TextIO) -> int:
     """
-    Convert a list of StartLists to a list of CSV strings.
+    Write a list of StartLists to a stream as CSV.
+
+    Each row is formatted by the csv module and written as it is generated,
+    so the CSV is never built up in memory. Fields that contain a comma or
+    quote are quoted.
 
-    :param startlists: The list of StartLists to convert
-    :returns: A list of CSV strings, one for each StartList
+    :param startlists: The list of StartLists to write
+    :param stream: The text stream (file) to write to
+    :returns: The number of events that were written
 
     Example usage::
     .. code-block:: python
-        csv_strings = startlists_to_csv(startlists)
+        with open(filename, "w", encoding="cp1252") as file:
+            num_events = write_startlists_csv(startlists, file)
     """
-    csv: list[str] = []
+    writer = csv.writer(stream, lineterminator="\n")
+    num_events = 0
+    for row in _csv_rows(startlists):
+        writer.writerow(row)
+        num_events += 1
+    return num_events
+
+
+def _csv_rows(startlists: list[StartList]) -> Iterator[tuple[str, str, int, int, str]]:
     for slist in startlists:
         if not is_valid(slist):
             continue
-        event = slist[0].event
-        name = slist[0].description
-        heats = len(slist)
-        csv.append(f"{event},{name},{heats},1,A\n")
-    return csv
+        yield (slist[0].event, slist[0].description, len(slist), 1, "A")
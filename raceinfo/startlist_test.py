@@ -0,0 +1,74 @@
+# Wahoo! Results - https://github.com/JohnStrunk/wahoo-results
+# Copyright (C) 2024 - John D. Strunk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for StartList functions."""
+
+# ruff: noqa: PLR2004 - Ignore magic numbers
+
+import io
+
+from .heatdata import HeatData
+from .startlist import StartList, write_startlists_csv
+
+
+def _startlist(event: str, description: str, heats: int) -> StartList:
+    return [
+        HeatData(event=event, description=description, heat=heat, lanes=[])
+        for heat in range(1, heats + 1)
+    ]
+
+
+class TestWriteStartlistsCSV:
+    """Tests for write_startlists_csv()."""
+
+    def test_plain_rows(self):
+        """Rows without special characters are written unquoted."""
+        startlists = [
+            _startlist("1", "GIRLS 10&U 50 FREE", 2),
+            _startlist("12A", "BOYS 13&O 100 FLY", 1),
+        ]
+        out = io.StringIO()
+        assert write_startlists_csv(startlists, out) == 2
+        # Same as the hand-built f"{event},{name},{heats},1,A\n" lines
+        assert out.getvalue() == (
+            "1,GIRLS 10&U 50 FREE,2,1,A\n12A,BOYS 13&O 100 FLY,1,1,A\n"
+        )
+
+    def test_quoted_rows(self):
+        """Descriptions with commas or quotes are quoted."""
+        startlists = [_startlist("1", 'Girls, 100 "Free"', 1)]
+        out = io.StringIO()
+        assert write_startlists_csv(startlists, out) == 1
+        assert out.getvalue() == '1,"Girls, 100 ""Free""",1,1,A\n'
+
+    def test_invalid_startlists_are_skipped(self):
+        """Empty or out-of-order start lists are not written or counted."""
+        out_of_order = _startlist("3", "MIXED 200 MEDLEY RELAY", 2)
+        out_of_order.reverse()
+        startlists = [
+            [],
+            _startlist("2", "BOYS 8&U 25 BACK", 3),
+            out_of_order,
+        ]
+        out = io.StringIO()
+        assert write_startlists_csv(startlists, out) == 1
+        assert out.getvalue() == "2,BOYS 8&U 25 BACK,3,1,A\n"
+
+    def test_nothing_to_write(self):
+        """No valid start lists produces an empty file."""
+        out = io.StringIO()
+        assert write_startlists_csv([], out) == 0
+        assert out.getvalue() == ""
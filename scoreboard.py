@@ -16,14 +16,15 @@
 
 """Generate an image of the scoreboard from a RaceTimes object."""
 
-from typing import Optional, Tuple
+import functools
+import os
+import threading
+from typing import ClassVar, Dict, Hashable, Optional, Tuple
 
 import sentry_sdk
-from matplotlib import font_manager  # type: ignore
 from PIL import Image, ImageDraw, ImageFont, UnidentifiedImageError
-from PIL.ImageEnhance import Brightness
 
-from model import Model
+from model import RenderConfig
 from raceinfo import (
     INCONSISTENT,
     NO_SHOW,
@@ -34,22 +35,27 @@ from raceinfo import (
     is_special_time,
 )
 
+# Images may be rendered on the UI thread and on a worker thread. The cached
+# fonts aren't safe to draw with concurrently, so renders take turns.
+_RENDER_LOCK = threading.Lock()
 
-def waiting_screen(size: Tuple[int, int], model: Model) -> Image.Image:
+
+def waiting_screen(size: Tuple[int, int], config: RenderConfig) -> Image.Image:
     """Generate a "waiting" image to display on the scoreboard.
 
     :param size: The size of the image in pixels
-    :param model: The application model state
+    :param config: The rendering preferences (see Model.snapshot())
     :returns: An image to display on the scoreboard
     """
-    img = Image.new(mode="RGBA", size=size, color=model.color_bg.get())
+    img = Image.new(mode="RGBA", size=size, color=config.color_bg)
     center = (int(size[0] * 0.5), int(size[1] * 0.8))
-    normal = fontname_to_file(model.font_normal.get())
+    normal = fontname_to_file(config.font_normal)
     font_size = 72
-    fnt = ImageFont.truetype(normal, font_size)
+    fnt = _truetype(normal, font_size)
     draw = ImageDraw.Draw(img)
-    color = model.color_event.get()
-    draw.text(center, "Waiting for results...", font=fnt, fill=color, anchor="ms")
+    color = config.color_event
+    with _RENDER_LOCK:
+        draw.text(center, "Waiting for results...", font=fnt, fill=color, anchor="ms")
     return img
 
 
@@ -59,96 +65,144 @@ class ScoreboardImage:
     _BORDER_FRACTION = 0.05  # Fraction of image left as a border around all sides
     _EVENT_SIZE = "E:MMM"
     _HEAT_SIZE = "H:MM"
+    __slots__ = (
+        "_config",
+        "_draw",
+        "_img",
+        "_line_height",
+        "_normal_font",
+        "_race",
+        "_text_height",
+        "_time_font",
+    )
     _img: Image.Image  # The rendered image
-    _lanes: int  # The number of lanes to display
+    _draw: ImageDraw.ImageDraw  # Drawing context for _img
     _line_height: int  # Height of a line of text (baseline to baseline), in px
     _text_height: int  # Height of actual text, in px
     _normal_font: ImageFont.FreeTypeFont  # Font for normal text
     _time_font: ImageFont.FreeTypeFont  # Font for printing times
+    # The most recent render key and the image it produced
+    _last_render: ClassVar[Optional[Tuple[Hashable, Image.Image]]] = None
 
     def __init__(
         self,
         size: Tuple[int, int],
         race: HeatData,
-        model: Model,
+        config: RenderConfig,
         background: bool = True,
     ):
         """
         Generate a scoreboard image from a RaceTimes object.
 
+        Since the settings are passed as a snapshot rather than read from the
+        model, the image can be generated on any thread.
+
         :param size: A tuple representing the size of the image in pixels
         :param race: The RaceTimes object containing the race result (and optionally the swimmer names/teams)
-        :param model: The model state that contains the rendering preferences
+        :param config: The rendering preferences (see Model.snapshot())
         """
-        with sentry_sdk.start_span(op="render_image", description="Render image"):
+        with (
+            sentry_sdk.start_span(op="render_image", description="Render image"),
+            _RENDER_LOCK,
+        ):
             self._race = race
-            self._model = model
-            # We save the lane count once because it's used multiple times, and we
-            # want to ensure the value doesn't change while we're building the
-            # scoreboard image
-            self._lanes = model.num_lanes.get()
-            bg_color = model.color_bg.get()
-            if not background:
-                bg_color = "#00000000"  # transparent
-            self._img = Image.new(mode="RGBA", size=size, color=bg_color)
-            if background:
-                self._add_bg_image()
+            self._config = config
+            # Sequential renders are frequently identical (e.g., the preview
+            # being refreshed), so reuse the previous image when nothing that
+            # affects its appearance has changed
+            key = self._render_key(size, background)
+            last = ScoreboardImage._last_render
+            if last is not None and last[0] == key:
+                self._img = last[1]
+                return
+            self._img = self._make_canvas(size, background)
+            self._draw = ImageDraw.Draw(self._img)
             self._load_fonts()
             self._draw_header()
             self._draw_lanes()
+            ScoreboardImage._last_render = (key, self._img)
 
     @property
     def image(self) -> Image.Image:
-        """The image of the scoreboard."""
+        """The image of the scoreboard.
+
+        The image may be shared with other ScoreboardImage instances, so it
+        must not be modified.
+        """
         return self._img
 
+    def _render_key(self, size: Tuple[int, int], background: bool) -> Hashable:
+        """Capture everything that determines the appearance of the image."""
+        bg_mtime: Optional[int] = None
+        if background and self._config.image_bg != "":
+            try:
+                bg_mtime = os.stat(self._config.image_bg).st_mtime_ns
+            except OSError:
+                pass
+        settings = (size, background, self._config, bg_mtime)
+        race = self._race
+        lanes = tuple(
+            (race.lane(i).name, race.place(i), self._time_text(i))
+            for i in range(1, self._config.num_lanes + 1)
+        )
+        return (settings, race.event, race.heat, race.description, lanes)
+
     @property
     def size(self):
         """Get the size of the image."""
         return self._img.size
 
-    def _add_bg_image(self) -> None:
-        bg_image_filename = self._model.image_bg.get()
+    def _make_canvas(self, size: Tuple[int, int], background: bool) -> Image.Image:
+        """Create the image to draw on, filled with the background."""
+        if not background:
+            return Image.new(mode="RGBA", size=size, color="#00000000")
+        bg_image = self._background_image(size)
+        if bg_image is not None and bg_image.mode == "RGB":
+            # An opaque image completely covers the background color, so it
+            # can be used directly as the canvas, saving a pass over the pixels
+            return bg_image.convert("RGBA")
+        canvas = Image.new(mode="RGBA", size=size, color=self._config.color_bg)
+        if bg_image is not None:
+            # Overlay it, respecting the alpha channel
+            canvas.alpha_composite(bg_image)
+        return canvas
+
+    def _background_image(self, size: Tuple[int, int]) -> Optional[Image.Image]:
+        bg_image_filename = self._config.image_bg
         if bg_image_filename == "":
-            return  # bg image not defined
+            return None  # bg image not defined
         try:
-            bg_image = Image.open(bg_image_filename)
-            # Ensure the size matches
-            bg_image = bg_image.resize(self.size, Image.Resampling.BICUBIC)
-            # Make sure the image modes match
-            bg_image = bg_image.convert("RGBA")
-            # Adjust the image brightness
-            bg_image = Brightness(bg_image).enhance(
-                float(self._model.brightness_bg.get()) / 100.0
+            return _load_bg_image(
+                bg_image_filename,
+                os.stat(bg_image_filename).st_mtime_ns,
+                size,
+                self._config.brightness_bg,
             )
-            # Overlay it, respecting the alpha channel
-            self._img.alpha_composite(bg_image)
         except FileNotFoundError:
-            return
+            return None
         except UnidentifiedImageError:
-            return
+            return None
         except ValueError:
-            return
+            return None
 
     def _load_fonts(self) -> None:
         usable_height = self.size[1] * (1 - (2 * self._BORDER_FRACTION))
-        lines = self._lanes
+        lines = self._config.num_lanes
         lines += 1  # Event num + Header
         lines += 1  # Heat num + Event descr
         lines += 1  # Name, team, time header
         self._line_height = int(usable_height / lines)
-        scaled_height = self._line_height / self._model.text_spacing.get()
-        normal_f_file = fontname_to_file(self._model.font_normal.get())
-        time_f_file = fontname_to_file(self._model.font_time.get())
-        self._normal_font = ImageFont.truetype(normal_f_file, int(scaled_height))
-        self._time_font = ImageFont.truetype(time_f_file, int(scaled_height))
-        draw = ImageDraw.Draw(self._img)
-        self._text_height = draw.textbbox((0, 0), self._EVENT_SIZE, self._normal_font)[
-            3
-        ]
+        scaled_height = self._line_height / self._config.text_spacing
+        normal_f_file = fontname_to_file(self._config.font_normal)
+        time_f_file = fontname_to_file(self._config.font_time)
+        self._normal_font = _truetype(normal_f_file, int(scaled_height))
+        self._time_font = _truetype(time_f_file, int(scaled_height))
+        # The text has no descenders, so its height is the font's ascent. This
+        # comes straight from the font metrics, without laying out any glyphs.
+        self._text_height = self._normal_font.getmetrics()[0]
 
     def _draw_header(self) -> None:
-        draw = ImageDraw.Draw(self._img)
+        draw = self._draw
         edge_l = int(self.size[0] * self._BORDER_FRACTION)
         edge_r = int(self.size[0] * (1 - self._BORDER_FRACTION))
         width = edge_r - edge_l
@@ -159,19 +213,17 @@ class ScoreboardImage:
             f"E:{self._race.event}",
             font=self._time_font,
             anchor="ls",
-            fill=self._model.color_event.get(),
+            fill=self._config.color_event,
         )
         hstart = edge_l + draw.textlength(self._EVENT_SIZE, self._normal_font)
         hwidth = width - hstart
-        head_txt = self._model.title.get()
-        while draw.textlength(head_txt, self._normal_font) > hwidth:
-            head_txt = head_txt[:-1]
+        head_txt = _fit_text(draw, self._config.title, self._normal_font, hwidth)
         draw.text(
             (edge_r, self._baseline(1)),
             head_txt,
             font=self._normal_font,
             anchor="rs",
-            fill=self._model.color_title.get(),
+            fill=self._config.color_title,
         )
 
         # Line2 - H: 99 Event description
@@ -180,23 +232,21 @@ class ScoreboardImage:
             f"H:{self._race.heat}",
             font=self._time_font,
             anchor="ls",
-            fill=self._model.color_event.get(),
+            fill=self._config.color_event,
         )
         dstart = edge_l + draw.textlength(self._HEAT_SIZE, self._normal_font)
         dwidth = width - dstart
-        desc_txt = self._race.description
-        while draw.textlength(desc_txt, self._normal_font) > dwidth:
-            desc_txt = desc_txt[:-1]
+        desc_txt = _fit_text(draw, self._race.description, self._normal_font, dwidth)
         draw.text(
             (edge_r, self._baseline(2)),
             desc_txt,
             font=self._normal_font,
             anchor="rs",
-            fill=self._model.color_event.get(),
+            fill=self._config.color_event,
         )
 
     def _draw_lanes(self) -> None:
-        draw = ImageDraw.Draw(self._img)
+        draw = self._draw
         edge_l = int(self.size[0] * self._BORDER_FRACTION)
         edge_r = int(self.size[0] * (1 - self._BORDER_FRACTION))
         width = edge_r - edge_l
@@ -207,7 +257,7 @@ class ScoreboardImage:
 
         # Lane title
         baseline = self._baseline(3)
-        title_color = self._model.color_event.get()
+        title_color = self._config.color_event
         draw.text(
             (edge_l, baseline),
             "L",
@@ -231,14 +281,23 @@ class ScoreboardImage:
         )
 
         # Lane data
-        for i in range(1, self._lanes + 1):
-            color = (
-                self._model.color_odd.get() if i % 2 else self._model.color_even.get()
-            )
-            line_num = 3 + i
+        # Everything that doesn't vary per lane is computed up front
+        x_lane = edge_l + idx_width / 2
+        x_place = edge_l + idx_width + pl_width / 2
+        x_name = edge_l + idx_width + pl_width
+        color_odd = self._config.color_odd
+        color_even = self._config.color_even
+        place_colors: Dict[Optional[int], str] = {
+            1: self._config.color_first,
+            2: self._config.color_second,
+            3: self._config.color_third,
+        }
+        for i in range(1, self._config.num_lanes + 1):
+            color = color_odd if i % 2 else color_even
+            baseline = self._baseline(3 + i)
             # Lane
             draw.text(
-                (edge_l + idx_width / 2, self._baseline(line_num)),
+                (x_lane, baseline),
                 f"{i}",
                 font=self._normal_font,
                 anchor="ms",
@@ -246,20 +305,12 @@ class ScoreboardImage:
             )
             # Place
             pl_num = self._race.place(i)
-            pl_color = color
-            if pl_num == 1:
-                pl_color = self._model.color_first.get()
-            if pl_num == 2:  # noqa: PLR2004
-                pl_color = self._model.color_second.get()
-            if pl_num == 3:  # noqa: PLR2004
-                pl_color = self._model.color_third.get()
-            ptxt = format_place(pl_num)
             draw.text(
-                (edge_l + idx_width + pl_width / 2, self._baseline(line_num)),
-                ptxt,
+                (x_place, baseline),
+                format_place(pl_num),
                 font=self._normal_font,
                 anchor="ms",
-                fill=pl_color,
+                fill=place_colors.get(pl_num, color),
             )
             # Name
             name_variants = format_name(NameMode.NONE, self._race.lane(i).name)
@@ -267,20 +318,31 @@ class ScoreboardImage:
                 name_variants.pop(0)
             name = name_variants[0]
             draw.text(
-                (edge_l + idx_width + pl_width, self._baseline(line_num)),
+                (x_name, baseline),
                 f"{name}",
                 font=self._normal_font,
                 anchor="ls",
                 fill=color,
             )
             # Time
-            draw.text(
-                (edge_r, self._baseline(line_num)),
-                self._time_text(i),
-                font=self._time_font,
-                anchor="rs",
-                fill=color,
-            )
+            self._draw_time((edge_r, baseline), self._time_text(i), color)
+
+    def _draw_time(self, xy: Tuple[int, int], text: str, color: str) -> None:
+        """Draw a time, right-aligned on its baseline.
+
+        Times use a tiny alphabet (digits and a few symbols), so rather than
+        laying out each string, the individual glyphs are rendered once and
+        pasted into place from right to left.
+
+        :param xy: The right edge and baseline of the text
+        :param text: The text to draw
+        :param color: The color of the text
+        """
+        x_pos = float(xy[0])
+        for char in reversed(text):
+            mask, left, top, advance = _glyph(self._time_font, char)
+            x_pos -= advance
+            self._img.paste(color, (round(x_pos) + left, xy[1] + top), mask)
 
     def _time_text(self, lane_num: int) -> str:
         lane = self._race.lane(lane_num)
@@ -306,9 +368,106 @@ class ScoreboardImage:
         )  # up 1/2 the inter-line space
 
 
+@functools.lru_cache(maxsize=4)
+def _load_bg_image(
+    filename: str, mtime_ns: int, size: Tuple[int, int], brightness: int
+) -> Image.Image:
+    """Load and prepare a background image for compositing.
+
+    Decoding, scaling, and adjusting the brightness of the background is the
+    most expensive part of rendering a scoreboard, but the result only changes
+    when the settings or the file itself change. The modification time is part
+    of the cache key so that an edited image is picked up. Callers must treat
+    the returned image as read-only since it is shared.
+
+    :param filename: The filename of the background image
+    :param mtime_ns: The modification time of the file
+    :param size: The size of the scoreboard image in pixels
+    :param brightness: The brightness adjustment, in percent
+    :returns: The scaled and adjusted background image, in RGB mode if it is
+        fully opaque, RGBA otherwise
+    """
+    with Image.open(filename) as bg_image:
+        # For JPEGs, let the decoder do most of the downscaling so that the
+        # full-resolution image is never materialized (no-op for other formats)
+        bg_image.draft("RGB", size)
+        # Ensure the size matches. When shrinking a much larger image (e.g., a
+        # photo), bilinear is visually indistinguishable and considerably
+        # cheaper than bicubic. This is judged on the size after draft(), since
+        # that is what actually gets resampled.
+        resample = Image.Resampling.BICUBIC
+        if bg_image.width * bg_image.height > 4 * size[0] * size[1]:
+            resample = Image.Resampling.BILINEAR
+        scaled = bg_image.resize(size, resample)
+    # Make sure the image modes match
+    scaled = scaled.convert("RGBA")
+    if scaled.getextrema()[3] == (255, 255):
+        # Fully opaque images don't need to be alpha blended onto the scoreboard
+        scaled = scaled.convert("RGB")
+    # Adjust the image brightness via a lookup table (a single pass over the
+    # pixels), leaving any alpha channel untouched
+    if brightness != 100:  # noqa: PLR2004
+        levels = [min(255, round(value * brightness / 100)) for value in range(256)]
+        identity = list(range(256)) if scaled.mode == "RGBA" else []
+        scaled = scaled.point(levels * 3 + identity)
+    return scaled
+
+
+def _fit_text(
+    draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont, width: float
+) -> str:
+    """Truncate text so that it fits within the given width.
+
+    Rather than dropping one character at a time, the cut point is estimated
+    from the ratio of the available width to the measured width, so only a
+    handful of measurements are needed even for long strings.
+
+    :param draw: The drawing context used to measure the text
+    :param text: The text to truncate
+    :param font: The font the text will be drawn with
+    :param width: The maximum width of the text, in px
+    :returns: The longest prefix of the text that fits within the width
+
+    >>> from PIL import Image, ImageDraw, ImageFont
+    >>> draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+    >>> font = ImageFont.load_default()
+    >>> _fit_text(draw, "Alexander Hamilton", font, 100)
+    'Alexander Hamilton'
+    >>> _fit_text(draw, "Alexander Hamilton", font, 0)
+    ''
+    >>> _fit_text(draw, "Alexander Hamilton", font, -100)
+    ''
+
+    Here the estimate undershoots, and a character is added back:
+
+    >>> _fit_text(draw, "Alexander Hamilton", font, 50)
+    'Alexander '
+    """
+    count = len(text)
+    measured = draw.textlength(text, font)
+    if measured <= width:
+        return text
+    # Shrink until it fits, guided by the measured/available ratio
+    while count > 0 and measured > width:
+        count = max(0, min(count - 1, int(count * width / measured)))
+        measured = draw.textlength(text[:count], font)
+    # The estimate may have overshot; add back characters that still fit
+    while count < len(text) and draw.textlength(text[: count + 1], font) <= width:
+        count += 1
+    return text[:count]
+
+
+_SIXTY = NumericTime("60")
+
+
+@functools.lru_cache(maxsize=1024)
 def format_time(seconds: NumericTime) -> str:
     """Format a time in minutes, seconds, and hundredths.
 
+    Decimal arithmetic and formatting are comparatively slow, and the times
+    of a heat are formatted again each time the scoreboard is drawn, so the
+    results are cached.
+
     :param seconds: The time in seconds
     :returns: A string representation of the time
 
@@ -321,25 +480,66 @@ def format_time(seconds: NumericTime) -> str:
     >>> format_time(NumericTime("120.0"))
     '2:00.00'
     """
-    sixty = NumericTime("60")
-    minutes = seconds // sixty
-    seconds = seconds % sixty
+    minutes, seconds = divmod(seconds, _SIXTY)
     if minutes == 0:
         return f"{seconds:05.2f}"
     return f"{minutes}:{seconds:05.2f}"
 
 
+@functools.lru_cache(maxsize=64)
+def _truetype(filename: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a font, reusing previously loaded instances.
+
+    Loading a font from disk is relatively expensive, and the same few
+    (font, size) pairs are used for every heat. The returned font objects are
+    only ever read from, so it is safe to share them between renders.
+
+    :param filename: The filename of the font
+    :param size: The size of the font, in points
+    :returns: The loaded font
+    """
+    return ImageFont.truetype(filename, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _glyph(
+    font: ImageFont.FreeTypeFont, char: str
+) -> Tuple[Image.Image, int, int, float]:
+    """Render a single character to a reusable mask.
+
+    :param font: The font to use
+    :param char: The character to render
+    :returns: A tuple of the mask, the offset of its top-left corner relative
+        to the glyph's origin on the baseline, and the advance width
+    """
+    left, top, right, bottom = font.getbbox(char, anchor="ls")
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)))
+    ImageDraw.Draw(mask).text((-left, -top), char, font=font, fill=255, anchor="ls")
+    return (mask, int(left), int(top), font.getlength(char))
+
+
+@functools.lru_cache(maxsize=32)
 def fontname_to_file(name: str) -> str:
     """Convert a font name (Roboto) to its corresponding filename.
 
+    Lookups are cached since the font list is static while the program runs.
+
     :param name: The name of the font
     :returns: The filename of the font
     """
+    # Importing matplotlib adds about 265 ms to startup, and it's only needed
+    # to find fonts, so the import is deferred until the first lookup
+    from matplotlib import font_manager  # type: ignore # noqa: PLC0415
+
     properties = font_manager.FontProperties(family=name, weight="bold")
     filename = font_manager.findfont(properties)
     return filename
 
 
+# Printable places for all the lanes we support
+_PLACES = ("", "1st", "2nd", "3rd", *(f"{place}th" for place in range(4, 11)))
+
+
 def format_place(place: Optional[int]) -> str:
     """
     Turn a numerical place into the printable string representation.
@@ -359,12 +559,6 @@ def format_place(place: Optional[int]) -> str:
     """
     if place is None:
         return ""
-    if place == 0:
-        return ""
-    if place == 1:
-        return "1st"
-    if place == 2:  # noqa: PLR2004
-        return "2nd"
-    if place == 3:  # noqa: PLR2004
-        return "3rd"
+    if place < len(_PLACES):
+        return _PLACES[place]
     return f"{place}th"
@@ -16,13 +16,22 @@
 
 """A scoreboard template for previews and theming."""
 
+import functools
+
 from raceinfo import HeatData, NumericTime, standard_resolver
 
+# Lane times for the template: 99:50.99, 99:51.99, ..., 99:59.99
+_LANE_TIMES = tuple(NumericTime(f"{seconds}.99") for seconds in range(5990, 6000))
+_RESOLVER = standard_resolver(2, NumericTime(0.30))
+
 
+@functools.cache
 def get_template() -> HeatData:
     """
     Return template data to create a scoreboard mockup.
 
+    The template is built once and shared, so it must not be modified.
+
     >>> from scoreboard import format_time
     >>> from raceinfo import NO_SHOW, INCONSISTENT
     >>> t = get_template()
@@ -40,9 +49,10 @@ def get_template() -> HeatData:
     'Brady, June A'
     >>> t.lane(3).team
     'TEAM'
+    >>> get_template() is t
+    True
     """
-    basetime = NumericTime("59.99") + NumericTime("60") * NumericTime("99")
-    lt = [basetime + i - 10 for i in range(1, 11)]
+    lt = _LANE_TIMES
     return HeatData(
         event="999",
         heat=99,
@@ -77,5 +87,5 @@ def get_template() -> HeatData:
                 name="Parsons, Marsha L", team="TEAM", times=[lt[9], lt[9], lt[9]]
             ),
         ],
-        time_resolver=standard_resolver(2, NumericTime(0.30)),
+        time_resolver=_RESOLVER,
     )
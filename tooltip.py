@@ -13,27 +13,103 @@ Modified to include a delay time by Victor Zaccardo, 25mar16
 
 import tkinter as tk
 
+# Bind tag shared by all widgets that have a tooltip
+_TAG = "ToolTip"
+# The tooltip for each widget, indexed by the widget's path name
+_tooltips: dict[str, "ToolTip"] = {}
+
+
+def _dispatch(event, method):
+    """Route an event on the shared bind tag to the widget's tooltip."""
+    tip = _tooltips.get(str(event.widget))
+    if tip is not None:
+        getattr(tip, method)(event)
+
+
+def _forget(event):
+    """Drop the tooltip of a widget that is being destroyed."""
+    tip = _tooltips.pop(str(event.widget), None)
+    if tip is not None:
+        tip._leave()
+
+
+class _TipWindow:
+    """The one window that displays whichever tooltip is currently active."""
+
+    _instance = None
+
+    @classmethod
+    def get(cls, widget):
+        """Return the tip window, creating it on first use."""
+        if cls._instance is None or not cls._instance.window.winfo_exists():
+            cls._instance = cls(widget.winfo_toplevel())
+        return cls._instance
+
+    def __init__(self, master):
+        """Create the (hidden) tip window."""
+        self.owner = None
+        self.window = tk.Toplevel(master)
+        # Leaves only the label and removes the app window
+        self.window.wm_overrideredirect(True)
+        self.window.withdraw()
+        self.label = tk.Label(
+            self.window,
+            justify="left",
+            background="#ffffff",
+            relief="solid",
+            borderwidth=1,
+        )
+        self.label.pack(ipadx=1)
+
+    def show(self, owner, x, y):
+        """Display the text of a tooltip at the given screen position."""
+        self.owner = owner
+        self.label.configure(text=owner.text, wraplength=owner.wraplength)
+        self.window.wm_geometry(f"+{x}+{y}")
+        self.window.deiconify()
+
+    def hide(self, owner):
+        """Hide the window if it is displaying the given tooltip."""
+        if self.owner is owner:
+            self.owner = None
+            self.window.withdraw()
+
 
 class ToolTip:
     """Create a tooltip for a given widget."""
 
+    __slots__ = ("_id", "_pointer", "text", "widget")
+    waittime = 500  # miliseconds
+    wraplength = 225  # pixels
+
     def __init__(self, widget, text="widget info"):
         """Create a tooltip for a given widget.
 
+        Rather than each tooltip binding its own event handlers, the widget
+        is given a shared bind tag, and one set of class bindings dispatches
+        to the tooltip registered for the widget.
+
         :param widget: The widget to bind the tooltip to.
         :param text: The text to display in the tooltip.
         """
-        self.waittime = 500  # miliseconds
-        self.wraplength = 225  # pixels
         self.widget = widget
         self.text = text
-        self.widget.bind("<Enter>", self._enter)
-        self.widget.bind("<Leave>", self._leave)
-        self.widget.bind("<ButtonPress>", self._leave)
         self._id = None
-        self._tip_win = None
-
-    def _enter(self, _=None):
+        self._pointer = (0, 0)
+        if not widget.bind_class(_TAG):
+            # First tooltip in this interpreter
+            widget.bind_class(_TAG, "<Enter>", lambda e: _dispatch(e, "_enter"))
+            widget.bind_class(_TAG, "<Leave>", lambda e: _dispatch(e, "_leave"))
+            widget.bind_class(_TAG, "<ButtonPress>", lambda e: _dispatch(e, "_leave"))
+            widget.bind_class(_TAG, "<Destroy>", _forget)
+        if str(widget) not in _tooltips:
+            widget.bindtags((_TAG, *widget.bindtags()))
+        _tooltips[str(widget)] = self
+
+    def _enter(self, event=None):
+        if event is not None:
+            # Place the tip where the pointer entered, as reported by the event
+            self._pointer = (event.x_root, event.y_root)
         self._schedule()
 
     def _leave(self, _=None):
@@ -41,7 +117,8 @@ class ToolTip:
         self._hidetip()
 
     def _schedule(self):
-        self._unschedule()
+        if self._id is not None or self._is_shown():
+            return  # Already on its way (or already up)
         self._id = self.widget.after(self.waittime, self._showtip)
 
     def _unschedule(self):
@@ -50,32 +127,21 @@ class ToolTip:
         if my_id:
             self.widget.after_cancel(my_id)
 
+    def _is_shown(self):
+        tip_win = _TipWindow._instance
+        return tip_win is not None and tip_win.owner is self
+
     def _showtip(self, _=None):
-        x = y = 0
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
-        # creates a toplevel window
-        self._tip_win = tk.Toplevel(self.widget)
-        # Leaves only the label and removes the app window
-        self._tip_win.wm_overrideredirect(True)
-        self._tip_win.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(
-            self._tip_win,
-            text=self.text,
-            justify="left",
-            background="#ffffff",
-            relief="solid",
-            borderwidth=1,
-            wraplength=self.wraplength,
-        )
-        label.pack(ipadx=1)
+        self._id = None
+        x, y = self._pointer
+        x += 25
+        y += 20
+        _TipWindow.get(self.widget).show(self, x, y)
 
     def _hidetip(self):
-        tip_win = self._tip_win
-        self._tip_win = None
-        if tip_win:
-            tip_win.destroy()
+        tip_win = _TipWindow._instance
+        if tip_win is not None:
+            tip_win.hide(self)
 
 
 # testing ...
@@ -26,10 +26,13 @@ import re
 import sys
 import threading
 import webbrowser
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from tkinter import Tk, filedialog, messagebox
-from typing import List, Optional
+from tkinter import TclError, Tk, filedialog, messagebox
+from typing import Deque, List, Optional, Tuple
 
+import PIL.Image as PILImage
 import sentry_sdk
 import sentry_sdk.scope
 from requests.exceptions import RequestException
@@ -48,15 +51,16 @@ import main_window
 import wh_analytics
 import wh_version
 from about import about
-from model import Model
+from model import Model, RenderConfig
 from raceinfo import (
     HeatData,
     NumericTime,
+    TimeResolver,
     load_all_scb,
     parse_do4_file,
     parse_scb_file,
     standard_resolver,
-    startlists_to_csv,
+    write_startlists_csv,
 )
 from scoreboard import ScoreboardImage, waiting_screen
 from template import get_template
@@ -64,6 +68,8 @@ from version import SENTRY_DSN, WAHOO_RESULTS_VERSION
 from watcher import DO4Watcher, SCBWatcher
 
 CONFIG_FILE = "wahoo-results.ini"
+_PREVIEW_DELAY_MS = 150  # Quiet time before re-rendering the preview
+_RACE_FILE_RE = re.compile(r"^(\d+)-")  # do4 files begin with the meet id
 logger = logging.getLogger(__name__)
 
 
@@ -111,7 +117,9 @@ def setup_template(model: Model) -> None:
         )
         if len(filename) == 0:
             return
-        template = ScoreboardImage(imagecast.IMAGE_SIZE, get_template(), model, True)
+        template = ScoreboardImage(
+            imagecast.IMAGE_SIZE, get_template(), model.snapshot(), True
+        )
         template.image.save(filename)
 
     model.menu_export_template.add(do_export)
@@ -144,12 +152,35 @@ def setup_appearance(model: Model) -> None:
 
     :param model: The application model
     """
+    pending_update: Optional[str] = None
 
     def update_preview() -> None:
         """Update the appearance preview with the current settings."""
-        preview = ScoreboardImage(imagecast.IMAGE_SIZE, get_template(), model)
+        nonlocal pending_update
+        pending_update = None
+        try:
+            preview = ScoreboardImage(
+                imagecast.IMAGE_SIZE, get_template(), model.snapshot()
+            )
+        except TclError:
+            # A setting is only partially entered (e.g., "0." in a spinbox), so
+            # wait for the next change
+            return
         model.appearance_preview.set(preview.image)
 
+    def schedule_update() -> None:
+        """Update the preview once the settings stop changing.
+
+        Typing in an entry or holding down a spinbox arrow generates a stream
+        of writes, and loading the settings changes many variables at once.
+        Each change restarts a short timer, so a burst of changes results in
+        a single render.
+        """
+        nonlocal pending_update
+        if pending_update is not None:
+            model.root.after_cancel(pending_update)
+        pending_update = model.root.after(_PREVIEW_DELAY_MS, update_preview)
+
     for element in [
         model.font_normal,
         model.font_time,
@@ -167,7 +198,7 @@ def setup_appearance(model: Model) -> None:
         model.brightness_bg,
         model.num_lanes,
     ]:
-        element.trace_add("write", lambda *_: update_preview())
+        element.trace_add("write", lambda *_: schedule_update())
     update_preview()
 
     def handle_bg_import() -> None:
@@ -178,6 +209,8 @@ def setup_appearance(model: Model) -> None:
         if len(image) == 0:
             return
         image = os.path.normpath(image)
+        # Repaint the area uncovered by the dialog before loading the image
+        model.root.update_idletasks()
         model.image_bg.set(image)
 
     model.bg_import.add(handle_bg_import)
@@ -197,6 +230,23 @@ def setup_scb_watcher(model: Model, observer: BaseObserver) -> None:
         startlists = load_all_scb(directory)
         model.startlist_contents.set(startlists)
 
+    # Copying a meet's start lists produces a burst of change events, but the
+    # whole directory is reloaded each time, so only one reload needs to be
+    # waiting in the queue.
+    reload_queued = threading.Event()
+
+    def startlists_changed() -> None:
+        """Queue a reload of the startlists unless one is already waiting."""
+        if not reload_queued.is_set():
+            reload_queued.set()
+            model.enqueue(reload_startlists)
+
+    def reload_startlists() -> None:
+        """Reload the startlists in response to a change in the directory."""
+        # Clear first so changes made during the reload queue another one
+        reload_queued.clear()
+        process_startlists()
+
     def scb_dir_updated() -> None:
         """When the startlist directory is changed, update the watched to look at the new directory and trigger processing of the startlists."""
         path = model.dir_startlist.get()
@@ -206,7 +256,7 @@ def setup_scb_watcher(model: Model, observer: BaseObserver) -> None:
         # When the watcher notices a change in the startlists, the update
         # needs to happen from the main thread, so we enqueue instead of
         # directly call process_startlists from the SCBWatcher.
-        observer.schedule(SCBWatcher(lambda: model.enqueue(process_startlists)), path)
+        observer.schedule(SCBWatcher(startlists_changed), path)
         logger.debug("scb watcher updated to %s", path)
         process_startlists()
 
@@ -220,28 +270,37 @@ def summarize_racedir(directory: str) -> List[HeatData]:
     :param directory: The directory to process
     :returns: A list of HeatData objects
     """
-    files = os.scandir(directory)
-    contents: List[HeatData] = []
-    for file in files:
-        if file.name.endswith(".do4"):
-            match = re.match(r"^(\d+)-", file.name)
-            if match is None:
-                continue
-            try:
-                result = parse_do4_file(file.path)
-                contents.append(result)
-            except ValueError:
-                pass
-            except OSError:
-                pass
-    return contents
-
-
-def load_result(model: Model, filename: str) -> Optional[HeatData]:
+    with os.scandir(directory) as files:
+        paths = [
+            file.path
+            for file in files
+            if file.name.endswith(".do4") and _RACE_FILE_RE.match(file.name)
+        ]
+    # A meet has hundreds of results, so overlap reading them
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        loaded = executor.map(_summarize_race, paths)
+        return [result for result in loaded if result is not None]
+
+
+def _summarize_race(path: str) -> Optional[HeatData]:
+    try:
+        return parse_do4_file(path)
+    except ValueError:
+        return None
+    except OSError:
+        return None
+
+
+def load_result(
+    filename: str, startlist_dir: str, resolver: TimeResolver
+) -> Optional[HeatData]:
     """Load a result file and corresponding startlist.
 
-    :param model: The application model
+    This does not touch the model, so it may be called from any thread.
+
     :param filename: The .do4 result file to load
+    :param startlist_dir: The directory holding the start lists
+    :param resolver: The time resolver to use for the result
     :returns: The HeatData object representing the result if successful,
         otherwise None
     """
@@ -251,9 +310,7 @@ def load_result(model: Model, filename: str) -> Optional[HeatData]:
     for tries in range(1, 6):
         try:
             result = parse_do4_file(filename)
-            result.resolver = standard_resolver(
-                model.min_times.get(), NumericTime(model.time_threshold.get())
-            )
+            result.resolver = resolver
             break
         except ValueError:
             sleep(0.05 * tries)
@@ -263,7 +320,7 @@ def load_result(model: Model, filename: str) -> Optional[HeatData]:
         return None
     efilename = f"E{result.event:0>3}.scb"
     try:
-        startlist = parse_scb_file(os.path.join(model.dir_startlist.get(), efilename))
+        startlist = parse_scb_file(os.path.join(startlist_dir, efilename))
         if len(startlist) >= result.heat:
             result.merge(info_from=startlist[result.heat - 1])
     except OSError:
@@ -273,6 +330,33 @@ def load_result(model: Model, filename: str) -> Optional[HeatData]:
     return result
 
 
+def render_result(
+    filename: str, startlist_dir: str, resolver: TimeResolver, config: RenderConfig
+) -> Optional[Tuple[HeatData, PILImage.Image]]:
+    """Load a result file and draw the scoreboard for it.
+
+    This runs on the result loader's worker thread, where an exception would
+    be stored in a Future that nothing reads. Errors are therefore logged
+    (and reported to Sentry via the logging integration) instead of raised.
+
+    :param filename: The .do4 result file to load
+    :param startlist_dir: The directory holding the start lists
+    :param resolver: The time resolver to use for the result
+    :param config: The scoreboard settings to render with
+    :returns: The result and its scoreboard image, or None if the result
+        couldn't be loaded or drawn
+    """
+    try:
+        result = load_result(filename, startlist_dir, resolver)
+        if result is None:
+            return None
+        image = ScoreboardImage(imagecast.IMAGE_SIZE, result, config).image
+    except Exception:
+        logger.exception("Unable to display result: %s", filename)
+        return None
+    return (result, image)
+
+
 def setup_do4_watcher(model: Model, observer: BaseObserver) -> None:
     """Set up watches for files/directories and connect to model.
 
@@ -290,21 +374,47 @@ def setup_do4_watcher(model: Model, observer: BaseObserver) -> None:
             span.set_tag("race_files", len(contents))
             model.results_contents.set(contents)
 
+    # Result files are read and rendered on a worker thread so that retrying a
+    # file that is still being written (or drawing the scoreboard) doesn't
+    # stall the UI. Only the newest result is worth showing, so a file that
+    # arrives while another is loading replaces any that are still waiting.
+    result_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result")
+    pending: Deque[Tuple[str, TimeResolver, str, RenderConfig]] = deque(maxlen=1)
+
     def process_new_result(file: str) -> None:
         """Process a new race result that has been detected.
 
         :param file: The new result file to process
         """
+        resolver = standard_resolver(
+            model.min_times.get(), NumericTime(model.time_threshold.get())
+        )
+        pending.append((file, resolver, model.dir_startlist.get(), model.snapshot()))
+        result_loader.submit(load_latest)
+
+    def load_latest() -> None:
+        """Load and render the newest pending result, if any."""
+        try:
+            file, resolver, startlist_dir, config = pending.popleft()
+        except IndexError:  # Already handled by an earlier run
+            return
         with sentry_sdk.start_transaction(op="new_result", name="New race result"):
-            result = load_result(model, file)
-            if result is None:
-                return
-            scoreboard = ScoreboardImage(imagecast.IMAGE_SIZE, result, model)
-            model.scoreboard.set(scoreboard.image)
-            model.latest_result.set(result)
-            num_cc = len([x for x in model.cc_status.get() if x.enabled])
-            wh_analytics.results_received(result.has_names(), num_cc)
-            process_racedir()  # update the UI
+            loaded = render_result(file, startlist_dir, resolver, config)
+        if loaded is not None:
+            result, image = loaded
+            model.enqueue(lambda: show_result(result, image))
+
+    def show_result(result: HeatData, image: PILImage.Image) -> None:
+        """Display a newly loaded race result.
+
+        :param result: The result to display
+        :param image: The scoreboard image for the result
+        """
+        model.scoreboard.set(image)
+        model.latest_result.set(result)
+        num_cc = len([x for x in model.cc_status.get() if x.enabled])
+        wh_analytics.results_received(result.has_names(), num_cc)
+        process_racedir()  # update the UI
 
     def do4_dir_updated() -> None:
         """When the raceresult directory is changed, update the watch to look at the new directory and trigger processing of the results."""
@@ -327,20 +437,47 @@ def setup_do4_watcher(model: Model, observer: BaseObserver) -> None:
 def check_for_update(model: Model) -> None:
     """Notify the user if there's a newer released version of Wahoo Results.
 
+    The check requires a network request, so it runs in a background thread
+    and the result is delivered to the UI via the model's event queue.
+
     :param model: The application model
     """
     current_version = model.version.get()
-    try:
-        latest_version = wh_version.latest()
-        if latest_version is not None and not wh_version.is_latest_version(
-            latest_version, current_version
-        ):
-            model.statustext.set(
-                f"New version available. Click to download: {latest_version.tag}"
-            )
-            model.statusclick.add(lambda: webbrowser.open(latest_version.url))
-    except RequestException as ex:
-        logger.warning("Error checking for update: %s", ex)
+
+    def notify(latest_version: wh_version.ReleaseInfo) -> None:
+        """Show the update notice in the status bar."""
+        model.statustext.set(
+            f"New version available. Click to download: {latest_version.tag}"
+        )
+        model.statusclick.add(lambda: webbrowser.open(latest_version.url))
+
+    def check() -> None:
+        """Query for the latest release."""
+        try:
+            latest_version = wh_version.latest()
+            if latest_version is not None and not wh_version.is_latest_version(
+                latest_version, current_version
+            ):
+                model.enqueue(lambda: notify(latest_version))
+        except RequestException as ex:
+            logger.warning("Error checking for update: %s", ex)
+
+    threading.Thread(target=check, name="update_check", daemon=True).start()
+
+
+def same_devices(
+    devices: List[imagecast.DeviceStatus], other: List[imagecast.DeviceStatus]
+) -> bool:
+    """Check whether two lists hold the same devices, in any order.
+
+    Discovery lists the devices in the order they were found, while the UI
+    sorts the model's list by name.
+
+    :param devices: A list of device statuses
+    :param other: The list of device statuses to compare with
+    :returns: True if both lists hold the same devices with the same status
+    """
+    return {dev.uuid: dev for dev in devices} == {dev.uuid: dev for dev in other}
 
 
 def setup_run(model: Model, icast: imagecast.ImageCast) -> None:
@@ -353,7 +490,14 @@ def setup_run(model: Model, icast: imagecast.ImageCast) -> None:
     def cast_discovery() -> None:
         """Update the list of Chromecasts in the model when the discovered device list changes."""
         dev_list = copy.deepcopy(icast.get_devices())
-        model.enqueue(lambda: model.cc_status.set(dev_list))
+        model.enqueue(lambda: show_devices(dev_list))
+
+    def show_devices(dev_list: List[imagecast.DeviceStatus]) -> None:
+        """Update the device list, skipping updates that change nothing."""
+        # Discovery reports every refresh of a device's service record, and
+        # each write rebuilds the device list in the UI
+        if not same_devices(dev_list, model.cc_status.get()):
+            model.cc_status.set(dev_list)
 
     def update_cc_list() -> None:
         """Notify the ImageCast object when a device should be en/dis-abled."""
@@ -494,11 +638,9 @@ def main() -> None:  # noqa: PLR0915
     def write_dolphin_csv():
         directory = model.dir_startlist.get()
         slists = load_all_scb(directory)
-        csv = startlists_to_csv(slists)
         filename = os.path.join(directory, "dolphin_events.csv")
         with open(filename, "w", encoding="cp1252") as file:
-            file.writelines(csv)
-        num_events = len(csv)
+            num_events = write_startlists_csv(slists, file)
         wh_analytics.wrote_dolphin_csv(num_events)
 
     model.dolphin_export.add(write_dolphin_csv)
@@ -509,7 +651,7 @@ def main() -> None:  # noqa: PLR0915
     icast.start()
 
     # Set initial scoreboard image
-    model.scoreboard.set(waiting_screen(imagecast.IMAGE_SIZE, model))
+    model.scoreboard.set(waiting_screen(imagecast.IMAGE_SIZE, model.snapshot()))
 
     # Analytics triggers
     model.menu_docs.add(wh_analytics.documentation_link)
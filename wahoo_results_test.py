@@ -0,0 +1,124 @@
+# Wahoo! Results - https://github.com/JohnStrunk/wahoo-results
+# Copyright (C) 2024 - John D. Strunk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the main application functions."""
+
+import copy
+import logging
+import os
+from uuid import UUID
+
+import pytest
+
+import wahoo_results
+from imagecast import DeviceStatus
+from model import RenderConfig
+from raceinfo import NumericTime, standard_resolver
+
+_RESULT_FILE = os.path.join(
+    os.path.dirname(__file__), "raceinfo", "testdata-dolphin", "008-002-001A-0003.do4"
+)
+
+
+class TestRenderResult:
+    """Tests for render_result()."""
+
+    @pytest.fixture()
+    def config(self) -> RenderConfig:
+        """Scoreboard settings to render with."""
+        return RenderConfig(
+            num_lanes=10,
+            font_normal="Helvetica",
+            font_time="Helvetica",
+            text_spacing=1.0,
+            title="Wahoo! Results",
+            image_bg="",
+            brightness_bg=100,
+            color_title="#ffffff",
+            color_event="#ffffff",
+            color_even="#ffffff",
+            color_odd="#ffffff",
+            color_first="#ffffff",
+            color_second="#ffffff",
+            color_third="#ffffff",
+            color_bg="#000000",
+        )
+
+    def test_result_is_rendered(self, monkeypatch, tmp_path, config):
+        """A result that loads is returned along with its scoreboard image."""
+
+        class FakeScoreboard:
+            def __init__(self, size, race, config):
+                self.image = (size, race.event)
+
+        monkeypatch.setattr(wahoo_results, "ScoreboardImage", FakeScoreboard)
+        resolver = standard_resolver(2, NumericTime("0.3"))
+        loaded = wahoo_results.render_result(
+            _RESULT_FILE, str(tmp_path), resolver, config
+        )
+        assert loaded is not None
+        result, image = loaded
+        assert result.event == "2"
+        assert image == (wahoo_results.imagecast.IMAGE_SIZE, "2")
+
+    def test_render_error_is_reported(self, monkeypatch, tmp_path, config, caplog):
+        """An error while drawing the scoreboard is logged, not lost."""
+
+        def broken_scoreboard(*_args, **_kwargs):
+            raise OSError("cannot open resource")
+
+        monkeypatch.setattr(wahoo_results, "ScoreboardImage", broken_scoreboard)
+        resolver = standard_resolver(2, NumericTime("0.3"))
+        with caplog.at_level(logging.ERROR, logger=wahoo_results.logger.name):
+            loaded = wahoo_results.render_result(
+                _RESULT_FILE, str(tmp_path), resolver, config
+            )
+        assert loaded is None
+        assert len(caplog.records) == 1
+        record = caplog.records[0]
+        assert _RESULT_FILE in record.getMessage()
+        assert record.exc_info is not None
+        assert isinstance(record.exc_info[1], OSError)
+
+
+class TestSameDevices:
+    """Tests for same_devices()."""
+
+    @pytest.fixture()
+    def discovered(self) -> list[DeviceStatus]:
+        """Devices in the order they were discovered (not sorted by name)."""
+        return [
+            DeviceStatus(uuid=UUID(int=2), name="Pool deck", enabled=True),
+            DeviceStatus(uuid=UUID(int=1), name="Lobby", enabled=False),
+        ]
+
+    def test_sorted_model_list_matches(self, discovered):
+        """The model's list, sorted by name in the UI, still compares equal."""
+        model_list = copy.deepcopy(discovered)
+        model_list.sort(key=lambda d: d.name)
+        assert model_list != discovered
+        assert wahoo_results.same_devices(discovered, model_list)
+
+    def test_changed_status_differs(self, discovered):
+        """A device that has been enabled or disabled is a change."""
+        model_list = copy.deepcopy(discovered)
+        model_list[1].enabled = True
+        assert not wahoo_results.same_devices(discovered, model_list)
+
+    def test_added_device_differs(self, discovered):
+        """A newly discovered device is a change."""
+        model_list = copy.deepcopy(discovered[:1])
+        assert not wahoo_results.same_devices(discovered, model_list)
@@ -17,7 +17,8 @@
 """Monitor the startlist directory."""
 
 import logging
-from typing import Callable
+import threading
+from typing import Callable, Dict
 
 import watchdog.events  # type: ignore
 
@@ -26,6 +27,10 @@ CreatedCallbackFn = Callable[[str], None]
 
 logger = logging.getLogger(__name__)
 
+# How long a new result file must go without further events before it is
+# reported
+_DO4_SETTLE_SECS = 0.25
+
 
 class SCBWatcher(watchdog.events.PatternMatchingEventHandler):
     """Monitors a directory for changes to CTS Startlist files."""
@@ -67,10 +72,15 @@ class DO4Watcher(watchdog.events.PatternMatchingEventHandler):
         """
         super().__init__(patterns=["*.do4"], ignore_directories=True)
         self._callback = callback
+        self._lock = threading.Lock()
+        self._pending: Dict[str, threading.Timer] = {}
 
     def on_created(self, event: watchdog.events.FileSystemEvent):
         """Handle a new .do4 file creation event by invoking the callback.
 
+        A burst of events for the same file is reported once, after the
+        events have stopped for a short time.
+
         :param event: The creation event
         """
         logger.debug(
@@ -79,4 +89,20 @@ class DO4Watcher(watchdog.events.PatternMatchingEventHandler):
         path = event.src_path
         if isinstance(path, bytes):
             path = path.decode()
-        self._callback(str(path))
+        path = str(path)
+        timer = threading.Timer(_DO4_SETTLE_SECS, self._settled, args=(path,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._pending.get(path)
+            if previous is not None:
+                previous.cancel()
+            self._pending[path] = timer
+        timer.start()
+
+    def _settled(self, path: str) -> None:
+        # Runs on the timer's own thread
+        with self._lock:
+            if self._pending.get(path) is not threading.current_thread():
+                return  # Superseded by a later event for the same file
+            del self._pending[path]
+        self._callback(path)
@@ -0,0 +1,92 @@
+# Wahoo! Results - https://github.com/JohnStrunk/wahoo-results
+# Copyright (C) 2024 - John D. Strunk
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Tests for the directory watchers."""
+
+import threading
+import time
+
+import pytest
+import watchdog.events  # type: ignore
+
+import watcher
+
+_SETTLE_SECS = 0.05
+
+
+class TestDO4Watcher:
+    """Tests for the debouncing of new .do4 file events."""
+
+    @pytest.fixture(autouse=True)
+    def short_settle(self, monkeypatch):
+        """Make the settle time short so the tests run quickly."""
+        monkeypatch.setattr(watcher, "_DO4_SETTLE_SECS", _SETTLE_SECS)
+
+    @pytest.fixture()
+    def reported(self):
+        """Record the paths passed to the callback, setting an event on each call."""
+        paths = []
+        called = threading.Event()
+
+        def callback(path):
+            paths.append(path)
+            called.set()
+
+        return paths, called, callback
+
+    def test_burst_is_reported_once(self, reported):
+        """Repeated events for the same file result in a single callback."""
+        paths, called, callback = reported
+        do4_watcher = watcher.DO4Watcher(callback)
+        event = watchdog.events.FileCreatedEvent("/results/1-001-001A-0001.do4")
+        do4_watcher.on_created(event)
+        do4_watcher.on_created(event)
+        assert called.wait(timeout=5)
+        # Give a superseded timer the chance to (wrongly) report as well
+        time.sleep(4 * _SETTLE_SECS)
+        assert paths == ["/results/1-001-001A-0001.do4"]
+
+    def test_each_file_is_reported(self, reported):
+        """Events for different files are each reported."""
+        paths, _called, callback = reported
+        do4_watcher = watcher.DO4Watcher(callback)
+        do4_watcher.on_created(
+            watchdog.events.FileCreatedEvent("/results/1-001-001A-0001.do4")
+        )
+        do4_watcher.on_created(
+            watchdog.events.FileCreatedEvent("/results/1-001-002A-0002.do4")
+        )
+        deadline = time.monotonic() + 5
+        while len(paths) < 2 and time.monotonic() < deadline:  # noqa: PLR2004
+            time.sleep(_SETTLE_SECS)
+        time.sleep(4 * _SETTLE_SECS)
+        assert sorted(paths) == [
+            "/results/1-001-001A-0001.do4",
+            "/results/1-001-002A-0002.do4",
+        ]
+
+    def test_superseded_timer_does_nothing(self, reported):
+        """A timer that fires after being replaced doesn't report the file."""
+        paths, called, callback = reported
+        do4_watcher = watcher.DO4Watcher(callback)
+        path = "/results/1-001-001A-0001.do4"
+        do4_watcher.on_created(watchdog.events.FileCreatedEvent(path))
+        # Stand in for a timer that was already firing when the event above
+        # replaced it: it isn't the registered timer, so it must not report
+        do4_watcher._settled(path)
+        assert paths == []
+        assert called.wait(timeout=5)
+        assert paths == [path]
@@ -49,7 +49,7 @@ def application_start(model: Model, screen_size: Tuple[int, int]) -> None:
         "context": _setup_context(screen_size),
         "race_count": 0,
         "race_count_with_names": 0,
-        "session_start": time.time(),
+        "session_start": time.monotonic(),
         "user_id": model.client_id.get(),
     }
 
@@ -72,7 +72,7 @@ def application_stop(model: Model) -> None:
     _send_event(
         "Scoreboard stopped",
         {
-            "runtime": time.time() - _CONTEXT["session_start"],
+            "runtime": time.monotonic() - _CONTEXT["session_start"],
             "race_count": _CONTEXT["race_count"],
             "race_count_with_names": _CONTEXT["race_count_with_names"],
             "lane_count": model.num_lanes.get(),
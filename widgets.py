@@ -21,7 +21,6 @@ from tkinter import (
     VERTICAL,
     Canvas,
     StringVar,
-    TclError,
     Widget,
     colorchooser,
     filedialog,
@@ -74,16 +73,20 @@ class ColorButton2(ttk.Button):
         self._color_var = color_var
 
         def _on_change(_a, _b, _c):
+            # Repaint the existing swatch in place rather than allocating a
+            # new PhotoImage and reconfiguring the button on every change
             try:
-                self._img = swatch(self.SWATCH_SIZE, self.SWATCH_SIZE, color_var.get())
-                self.configure(image=self._img)
-            except TclError:  # configuring an invalid color throws
-                pass
+                color = PILImage.new(
+                    "RGBA", (self.SWATCH_SIZE, self.SWATCH_SIZE), color_var.get()
+                )
+            except ValueError:  # an invalid color can't be drawn
+                return
+            self._img.paste(color)
 
         self._color_var.trace_add("write", _on_change)
 
     def _btn_cb(self) -> None:
-        (_, rgb) = colorchooser.askcolor(self._color_var.get())
+        (_, rgb) = colorchooser.askcolor(self._color_var.get(), parent=self)
         if rgb is not None:
             self._color_var.set(rgb)
 
@@ -101,19 +104,27 @@ class Preview(Canvas):
         :param image_var: Variable to hold the associated image
         """
         super().__init__(parent, width=self.WIDTH, height=self.HEIGHT)
-        self._pimage: Optional[ImageTk.PhotoImage] = None
+        # The canvas item and its PhotoImage are created once and then updated
+        # in place. Note: In order for the image to display on the canvas, we
+        # need to keep a reference to it.
+        self._pimage = ImageTk.PhotoImage(
+            PILImage.new("RGBA", (self.WIDTH, self.HEIGHT), "#00000000")
+        )
+        self.create_image(0, 0, image=self._pimage, anchor="nw")
+        self._shown: Optional[PILImage.Image] = None
         self._image_var = image_var
         image_var.trace_add("write", lambda *_: self._set_image(self._image_var.get()))
+        self._set_image(image_var.get())
 
     def _set_image(self, image: PILImage.Image) -> None:
         """Set the preview image."""
-        self.delete("all")
-        scaled = image.resize((self.WIDTH, self.HEIGHT))
-        # Note: In order for the image to display on the canvas, we need to
-        # keep a reference to it, so it gets assigned to _pimage even though
-        # it's not used anywhere else.
-        self._pimage = ImageTk.PhotoImage(scaled)
-        self.create_image(0, 0, image=self._pimage, anchor="nw")
+        if image is self._shown:
+            return  # Already displayed (e.g., an unchanged re-render)
+        if 0 in image.size:
+            return  # No image has been set yet
+        self._shown = image
+        scaled = image.resize((self.WIDTH, self.HEIGHT), PILImage.Resampling.BILINEAR)
+        self._pimage.paste(scaled)
 
 
 class StartListTreeView(ttk.Frame):
@@ -143,6 +154,7 @@ class StartListTreeView(ttk.Frame):
         self.tview.heading("heats", anchor="w", text="Heats")
         self.startlist = startlist
         startlist.trace_add("write", lambda *_: self._update_contents())
+        self._update_contents()
 
     def _update_contents(self):
         self.tview.delete(*self.tview.get_children())
@@ -172,21 +184,22 @@ class DirSelection(ttk.Frame):
         self.columnconfigure(1, weight=1)
         self.btn = ttk.Button(self, text="Browse...", command=self._handle_browse)
         self.btn.grid(column=0, row=0, sticky="news")
-        self.dir_label = StringVar()
-        ttk.Label(self, textvariable=self.dir_label, relief="sunken").grid(
-            column=1, row=0, sticky="news"
-        )
-        self.dir.trace_add(
-            "write",
-            lambda *_: self.dir_label.set(os.path.basename(self.dir.get())[-20:]),
-        )
-        self.dir.set(self.dir.get())
+        self.dir_label = ttk.Label(self, relief="sunken")
+        self.dir_label.grid(column=1, row=0, sticky="news")
+        self.dir.trace_add("write", lambda *_: self._update_label())
+        self._update_label()
+
+    def _update_label(self) -> None:
+        self.dir_label.configure(text=os.path.basename(self.dir.get())[-20:])
 
     def _handle_browse(self) -> None:
         directory = filedialog.askdirectory(initialdir=self.dir.get())
         if len(directory) == 0:
             return
         directory = os.path.normpath(directory)
+        # Repaint the area uncovered by the dialog before setting the
+        # directory, since processing the new directory can take a while
+        self.update_idletasks()
         self.dir.set(directory)
 
 
@@ -219,6 +232,7 @@ class RaceResultTreeView(ttk.Frame):
         self.tview.heading("time", anchor="w", text="Time")
         self.racelist = racelist
         racelist.trace_add("write", lambda *_: self._update_contents())
+        self._update_contents()
 
     def _update_contents(self):
         self.tview.delete(*self.tview.get_children())
@@ -260,6 +274,7 @@ class ChromcastSelector(ttk.Frame):
         self.tview.column("cc_name", anchor="w", minwidth=100)
         self.tview.heading("cc_name", anchor="w", text="Chromecast name")
         self.devstatus = statusvar
+        self._rows: dict[str, tuple[str, str]] = {}  # Displayed values by row id
         self.devstatus.trace_add("write", lambda *_: self._update_contents())
         # Needs to be the ButtonRelease event because the Button event happens
         # before the focus is actually set/changed.
@@ -267,15 +282,28 @@ class ChromcastSelector(ttk.Frame):
         self._update_contents()
 
     def _update_contents(self) -> None:
-        self.tview.delete(*self.tview.get_children())
         local_list = self.devstatus.get()
         # Sort them by name for display
         local_list.sort(key=lambda d: (d.name))
-        for dev in local_list:
-            txt_status = "Yes" if dev.enabled else "No"
-            self.tview.insert(
-                "", "end", id=str(dev.uuid), values=[txt_status, dev.name]
-            )
+        # Rather than rebuilding the whole list (which resets the scroll
+        # position and redraws every row), only touch the rows that changed
+        rows = {
+            str(dev.uuid): ("Yes" if dev.enabled else "No", dev.name)
+            for dev in local_list
+        }
+        removed = [iid for iid in self._rows if iid not in rows]
+        if removed:
+            self.tview.delete(*removed)
+        for index, (iid, values) in enumerate(rows.items()):
+            if iid not in self._rows:
+                self.tview.insert("", index, id=iid, values=values)
+            elif self._rows[iid] != values:
+                self.tview.item(iid, values=values)
+        if list(rows) != list(self.tview.get_children()):
+            # A device was renamed, so the sort order changed
+            for index, iid in enumerate(rows):
+                self.tview.move(iid, "", index)
+        self._rows = rows
 
     def _item_clicked(self, _event) -> None:
         item = self.tview.focus()
@@ -291,6 +319,11 @@ class ChromcastSelector(ttk.Frame):
 class RaceResultView(ttk.LabelFrame):
     """Widget that displays a RaceResult."""
 
+    # The row id and the values shown when there's no result, for each lane
+    _EMPTY_ROWS = tuple(
+        (str(lane), (str(lane), "", "", "", "")) for lane in range(1, 11)
+    )
+
     def __init__(self, parent: Widget, resultvar: RaceResultVar) -> None:
         """Widget that displays a RaceResult.
 
@@ -321,34 +354,33 @@ class RaceResultView(ttk.LabelFrame):
         self.tview.column("t3", anchor="e", width=time_width)
         self.tview.heading("final", anchor="e", text="Final")
         self.tview.column("final", anchor="e", width=time_width)
+        # There is always one row per lane; updates only change their values
+        for row_id, values in self._EMPTY_ROWS:
+            self.tview.insert("", "end", id=row_id, values=values)
         self._update()
 
     def _update(self) -> None:
-        self.tview.delete(*self.tview.get_children())
         result = self._resultvar.get()
+        if result is None:
+            for row_id, values in self._EMPTY_ROWS:
+                self.tview.item(row_id, values=values)
+            return
         for lane in range(1, 11):
-            if result is None:
-                self.tview.insert(
-                    "", "end", id=str(lane), values=[str(lane), "", "", "", ""]
-                )
+            rawtimes = result.lane(lane).times
+            timestr = [
+                scoreboard.format_time(t) if t is not None else "" for t in rawtimes
+            ]
+            final = result.lane(lane).time()
+            if not is_special_time(final):
+                assert isinstance(final, NumericTime)
+                finalstr = scoreboard.format_time(final)
+            elif final == NO_SHOW:
+                finalstr = "NS"
+            elif final == DQ:
+                finalstr = "DQ"
             else:
-                rawtimes = result.lane(lane).times
-                timestr = [
-                    scoreboard.format_time(t) if t is not None else "" for t in rawtimes
-                ]
-                final = result.lane(lane).time()
-                if not is_special_time(final):
-                    assert isinstance(final, NumericTime)
-                    finalstr = scoreboard.format_time(final)
-                elif final == NO_SHOW:
-                    finalstr = "NS"
-                elif final == DQ:
-                    finalstr = "DQ"
-                else:
-                    finalstr = "????"
-                self.tview.insert(
-                    "",
-                    "end",
-                    id=str(lane),
-                    values=[str(lane), timestr[0], timestr[1], timestr[2], finalstr],
-                )
+                finalstr = "????"
+            self.tview.item(
+                str(lane),
+                values=[str(lane), timestr[0], timestr[1], timestr[2], finalstr],
+            )